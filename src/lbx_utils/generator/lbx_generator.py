@@ -18,6 +18,69 @@ from rich.console import Console
 from ..models import LabelConfig, TextObject, ImageObject, GroupObject, ContainerObject, BarcodeObject
 from ..utils import LABEL_SIZES, DEFAULT_PRINTER_ID, DEFAULT_PRINTER_NAME, convert_to_pt
 from ..utils.conversion import MM_TO_PT
+from ..utils.archive import zip_compression
+
+# Namespace-qualified (Clark notation) tags for the elements the generator writes
+_PT_NS = "{http://schemas.brother.info/ptouch/2007/lbx/main}"
+_STYLE_NS = "{http://schemas.brother.info/ptouch/2007/lbx/style}"
+_TEXT_NS = "{http://schemas.brother.info/ptouch/2007/lbx/text}"
+_IMAGE_NS = "{http://schemas.brother.info/ptouch/2007/lbx/image}"
+_BARCODE_NS = "{http://schemas.brother.info/ptouch/2007/lbx/barcode}"
+_META_NS = "{http://schemas.brother.info/ptouch/2007/lbx/meta}"
+
+PT_BODY = _PT_NS + "body"
+PT_BRUSH = _PT_NS + "brush"
+PT_DATA = _PT_NS + "data"
+PT_DOCUMENT = _PT_NS + "document"
+PT_EXPANDED = _PT_NS + "expanded"
+PT_GROUP = _PT_NS + "group"
+PT_OBJECTS = _PT_NS + "objects"
+PT_OBJECT_STYLE = _PT_NS + "objectStyle"
+PT_PEN = _PT_NS + "pen"
+
+STYLE_BACK_GROUND = _STYLE_NS + "backGround"
+STYLE_CUT_LINE = _STYLE_NS + "cutLine"
+STYLE_PAPER = _STYLE_NS + "paper"
+STYLE_SHEET = _STYLE_NS + "sheet"
+
+TEXT_FONT_EXT = _TEXT_NS + "fontExt"
+TEXT_LOG_FONT = _TEXT_NS + "logFont"
+TEXT_PT_FONT_INFO = _TEXT_NS + "ptFontInfo"
+TEXT_STRING_ITEM = _TEXT_NS + "stringItem"
+TEXT_TEXT = _TEXT_NS + "text"
+TEXT_TEXT_ALIGN = _TEXT_NS + "textAlign"
+TEXT_TEXT_CONTROL = _TEXT_NS + "textControl"
+TEXT_TEXT_STYLE = _TEXT_NS + "textStyle"
+
+IMAGE_EFFECT = _IMAGE_NS + "effect"
+IMAGE_FORMAT = _IMAGE_NS + "format"
+IMAGE_IMAGE = _IMAGE_NS + "image"
+IMAGE_MONO = _IMAGE_NS + "mono"
+IMAGE_ORG_POS = _IMAGE_NS + "orgPos"
+IMAGE_STYLE = _IMAGE_NS + "style"
+IMAGE_TRIMMING = _IMAGE_NS + "trimming"
+
+BARCODE_BARCODE = _BARCODE_NS + "barcode"
+BARCODE_BARCODE_STYLE = _BARCODE_NS + "barcodeStyle"
+BARCODE_DATAMATRIX_STYLE = _BARCODE_NS + "datamatrixStyle"
+BARCODE_MAXICODE_STYLE = _BARCODE_NS + "maxicodeStyle"
+BARCODE_PDF417_STYLE = _BARCODE_NS + "pdf417Style"
+BARCODE_QRCODE_STYLE = _BARCODE_NS + "qrcodeStyle"
+BARCODE_RSS_STYLE = _BARCODE_NS + "rssStyle"
+
+META_APP_NAME = _META_NS + "appName"
+META_EDIT_TIME = _META_NS + "editTime"
+META_KEYWORD = _META_NS + "keyword"
+META_LAST_PRINTED = _META_NS + "lastPrinted"
+META_MODIFIED_BY = _META_NS + "modifiedBy"
+META_NUM_CHARS = _META_NS + "numChars"
+META_NUM_PAGES = _META_NS + "numPages"
+META_NUM_WORDS = _META_NS + "numWords"
+META_PROPERTIES = _META_NS + "properties"
+META_REVISION = _META_NS + "revision"
+META_SECURITY = _META_NS + "security"
+META_TEMPLATE = _META_NS + "template"
+META_TRANSFER_SCRIPT = _META_NS + "transferScript"
 
 # Create console for rich output
 console = Console()
@@ -48,17 +111,17 @@ class LbxGenerator:
         }
 
         # Create root element with namespaces
-        root = etree.Element("{http://schemas.brother.info/ptouch/2007/lbx/main}document",
+        root = etree.Element(PT_DOCUMENT,
                             attrib={"version": "1.9", "generator": "com.brother.PtouchEditor"},
                             nsmap=nsmap)
 
         # Add body element
-        body = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/main}body")
+        body = etree.SubElement(root, PT_BODY)
         body.set("currentSheet", "Sheet 1")
         body.set("direction", "LTR")
 
         # Add sheet element
-        sheet = etree.SubElement(body, "{http://schemas.brother.info/ptouch/2007/lbx/style}sheet")
+        sheet = etree.SubElement(body, STYLE_SHEET)
         sheet.set("name", "Sheet 1")
 
         # Add paper element with size-specific attributes
@@ -66,7 +129,7 @@ class LbxGenerator:
         console.print(f"[blue]Using label size: {size_mm}mm (format code: {LABEL_SIZES[size_mm]['format']})[/blue]")
 
         size_config = LABEL_SIZES[size_mm]
-        paper = etree.SubElement(sheet, "{http://schemas.brother.info/ptouch/2007/lbx/style}paper")
+        paper = etree.SubElement(sheet, STYLE_PAPER)
         paper.set("media", "0")
         paper.set("width", size_config["width"])
 
@@ -131,7 +194,7 @@ class LbxGenerator:
         paper.set("printerName", DEFAULT_PRINTER_NAME)
 
         # Add cut line element
-        cut_line = etree.SubElement(sheet, "{http://schemas.brother.info/ptouch/2007/lbx/style}cutLine")
+        cut_line = etree.SubElement(sheet, STYLE_CUT_LINE)
         cut_line.set("regularCut", "0pt")
         cut_line.set("freeCut", "")
 
@@ -144,7 +207,7 @@ class LbxGenerator:
             background_width = paper_height
 
         # Set up the background element based on orientation
-        background = etree.SubElement(sheet, "{http://schemas.brother.info/ptouch/2007/lbx/style}backGround")
+        background = etree.SubElement(sheet, STYLE_BACK_GROUND)
 
         # Default values (for landscape)
         bg_x = "5.6pt"
@@ -178,7 +241,7 @@ class LbxGenerator:
         background.set("backPrintColorNumber", "0")
 
         # Add objects container
-        objects = etree.SubElement(sheet, "{http://schemas.brother.info/ptouch/2007/lbx/main}objects")
+        objects = etree.SubElement(sheet, PT_OBJECTS)
 
         # Process each object from the config
         for obj in self.config.objects:
@@ -207,7 +270,7 @@ class LbxGenerator:
             parent_coords: Optional (x,y) tuple of parent coordinates for nested elements
         """
         # Create text element
-        text_elem = etree.SubElement(parent, "{http://schemas.brother.info/ptouch/2007/lbx/text}text")
+        text_elem = etree.SubElement(parent, TEXT_TEXT)
 
         # Get label size configuration
         size_config = LABEL_SIZES[self.config.size_mm]
@@ -216,131 +279,142 @@ class LbxGenerator:
         console.print(f"[blue]Text object positioning: x={text_obj.x}, y={text_obj.y}[/blue]")
         console.print(f"[blue]Text object dimensions: width={text_obj.width}, height={text_obj.height}[/blue]")
 
-        # Add object style
-        obj_style = etree.SubElement(text_elem, "{http://schemas.brother.info/ptouch/2007/lbx/main}objectStyle")
-
         # Use convert_to_pt to ensure all values are in points
         x_value_str = convert_to_pt(text_obj.x)
         y_value_str = convert_to_pt(text_obj.y)
 
-        obj_style.set("x", x_value_str)
-        obj_style.set("y", y_value_str)
-        obj_style.set("width", text_obj.width)
-        obj_style.set("height", text_obj.height)
-        obj_style.set("backColor", "#FFFFFF")
-        obj_style.set("backPrintColorNumber", "0")
-        obj_style.set("ropMode", "COPYPEN")
-        obj_style.set("angle", "0" if not text_obj.vertical else "90")
-        obj_style.set("anchor", "TOPLEFT")
-        obj_style.set("flip", "NONE")
+        # Add object style
+        obj_style = etree.SubElement(text_elem, PT_OBJECT_STYLE, attrib={
+            "x": x_value_str,
+            "y": y_value_str,
+            "width": text_obj.width,
+            "height": text_obj.height,
+            "backColor": "#FFFFFF",
+            "backPrintColorNumber": "0",
+            "ropMode": "COPYPEN",
+            "angle": "0" if not text_obj.vertical else "90",
+            "anchor": "TOPLEFT",
+            "flip": "NONE"
+        })
 
         # Add pen (border)
-        pen = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}pen")
-        pen.set("style", "NULL")
-        pen.set("widthX", "0.5pt")
-        pen.set("widthY", "0.5pt")
-        pen.set("color", "#000000")
-        pen.set("printColorNumber", "1")
+        pen = etree.SubElement(obj_style, PT_PEN, attrib={
+            "style": "NULL",
+            "widthX": "0.5pt",
+            "widthY": "0.5pt",
+            "color": "#000000",
+            "printColorNumber": "1"
+        })
 
         # Add brush
-        brush = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}brush")
-        brush.set("style", "NULL")
-        brush.set("color", "#000000")
-        brush.set("printColorNumber", "1")
-        brush.set("id", "0")
+        brush = etree.SubElement(obj_style, PT_BRUSH, attrib={
+            "style": "NULL",
+            "color": "#000000",
+            "printColorNumber": "1",
+            "id": "0"
+        })
 
         # Add expanded properties
-        expanded = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}expanded")
         obj_name = f"Text{uuid.uuid4().hex[:4]}"
         if text_obj.name:
             obj_name = text_obj.name
-        expanded.set("objectName", obj_name)
-        expanded.set("ID", "0")
-        expanded.set("lock", "0")
-        expanded.set("templateMergeTarget", "LABELLIST")
-        expanded.set("templateMergeType", "NONE")
-        expanded.set("templateMergeID", "0")
-        expanded.set("linkStatus", "NONE")
-        expanded.set("linkID", "0")
+        expanded = etree.SubElement(obj_style, PT_EXPANDED, attrib={
+            "objectName": obj_name,
+            "ID": "0",
+            "lock": "0",
+            "templateMergeTarget": "LABELLIST",
+            "templateMergeType": "NONE",
+            "templateMergeID": "0",
+            "linkStatus": "NONE",
+            "linkID": "0"
+        })
 
         # Add font info
-        font_info_elem = etree.SubElement(text_elem, "{http://schemas.brother.info/ptouch/2007/lbx/text}ptFontInfo")
+        font_info_elem = etree.SubElement(text_elem, TEXT_PT_FONT_INFO)
 
         # Add log font
-        log_font = etree.SubElement(font_info_elem, "{http://schemas.brother.info/ptouch/2007/lbx/text}logFont")
-        log_font.set("name", text_obj.font_info.name)
-        log_font.set("width", "0")
-        log_font.set("italic", text_obj.font_info.italic)
-        log_font.set("weight", text_obj.font_info.weight)
-        log_font.set("charSet", "0")
-        log_font.set("pitchAndFamily", "2")
+        log_font = etree.SubElement(font_info_elem, TEXT_LOG_FONT, attrib={
+            "name": text_obj.font_info.name,
+            "width": "0",
+            "italic": text_obj.font_info.italic,
+            "weight": text_obj.font_info.weight,
+            "charSet": "0",
+            "pitchAndFamily": "2"
+        })
 
         # Add font extension
-        font_ext = etree.SubElement(font_info_elem, "{http://schemas.brother.info/ptouch/2007/lbx/text}fontExt")
-        font_ext.set("effect", "NOEFFECT")
-        font_ext.set("underline", text_obj.font_info.underline)
-        font_ext.set("strikeout", "0")
-        font_ext.set("size", text_obj.font_info.size)
-        font_ext.set("orgSize", text_obj.font_info.org_size)
-        font_ext.set("textColor", text_obj.font_info.color)
-        font_ext.set("textPrintColorNumber", text_obj.font_info.print_color_number)
+        font_ext = etree.SubElement(font_info_elem, TEXT_FONT_EXT, attrib={
+            "effect": "NOEFFECT",
+            "underline": text_obj.font_info.underline,
+            "strikeout": "0",
+            "size": text_obj.font_info.size,
+            "orgSize": text_obj.font_info.org_size,
+            "textColor": text_obj.font_info.color,
+            "textPrintColorNumber": text_obj.font_info.print_color_number
+        })
 
         # Add text control
-        text_control = etree.SubElement(text_elem, "{http://schemas.brother.info/ptouch/2007/lbx/text}textControl")
-        text_control.set("control", "AUTOLEN")
-        text_control.set("clipFrame", "false")
-        text_control.set("aspectNormal", "true")
-        text_control.set("shrink", "true")
-        text_control.set("autoLF", "false")
-        text_control.set("avoidImage", "false")
+        text_control = etree.SubElement(text_elem, TEXT_TEXT_CONTROL, attrib={
+            "control": "AUTOLEN",
+            "clipFrame": "false",
+            "aspectNormal": "true",
+            "shrink": "true",
+            "autoLF": "false",
+            "avoidImage": "false"
+        })
 
         # Add text alignment
         align_value = text_obj.align.upper()
-        text_align = etree.SubElement(text_elem, "{http://schemas.brother.info/ptouch/2007/lbx/text}textAlign")
-        text_align.set("horizontalAlignment", align_value)
-        text_align.set("verticalAlignment", "TOP")
-        text_align.set("inLineAlignment", "BASELINE")
+        text_align = etree.SubElement(text_elem, TEXT_TEXT_ALIGN, attrib={
+            "horizontalAlignment": align_value,
+            "verticalAlignment": "TOP",
+            "inLineAlignment": "BASELINE"
+        })
 
         # Add text style
-        text_style = etree.SubElement(text_elem, "{http://schemas.brother.info/ptouch/2007/lbx/text}textStyle")
-        text_style.set("vertical", "true" if text_obj.vertical else "false")
-        text_style.set("nullBlock", "false")
-        text_style.set("charSpace", "0")
-        text_style.set("lineSpace", "0")
-        text_style.set("orgPoint", text_obj.font_info.size)
-        text_style.set("combinedChars", "false")
+        text_style = etree.SubElement(text_elem, TEXT_TEXT_STYLE, attrib={
+            "vertical": "true" if text_obj.vertical else "false",
+            "nullBlock": "false",
+            "charSpace": "0",
+            "lineSpace": "0",
+            "orgPoint": text_obj.font_info.size,
+            "combinedChars": "false"
+        })
 
         # Add data - we'll set the text content here
-        data = etree.SubElement(text_elem, "{http://schemas.brother.info/ptouch/2007/lbx/main}data")
+        data = etree.SubElement(text_elem, PT_DATA)
         # Store for later
         data.attrib["_text_content"] = text_obj.text
 
         # Add string items
         for item in text_obj.string_items:
-            string_item = etree.SubElement(text_elem, "{http://schemas.brother.info/ptouch/2007/lbx/text}stringItem")
-            string_item.set("charLen", str(item.char_len))
+            string_item = etree.SubElement(text_elem, TEXT_STRING_ITEM, attrib={
+                "charLen": str(item.char_len)
+            })
 
             # Add font info for string item
-            item_font_info = etree.SubElement(string_item, "{http://schemas.brother.info/ptouch/2007/lbx/text}ptFontInfo")
+            item_font_info = etree.SubElement(string_item, TEXT_PT_FONT_INFO)
 
             # Add log font for string item
-            item_log_font = etree.SubElement(item_font_info, "{http://schemas.brother.info/ptouch/2007/lbx/text}logFont")
-            item_log_font.set("name", item.font_info.name)
-            item_log_font.set("width", "0")
-            item_log_font.set("italic", item.font_info.italic)
-            item_log_font.set("weight", item.font_info.weight)
-            item_log_font.set("charSet", "0")
-            item_log_font.set("pitchAndFamily", "2")
+            item_log_font = etree.SubElement(item_font_info, TEXT_LOG_FONT, attrib={
+                "name": item.font_info.name,
+                "width": "0",
+                "italic": item.font_info.italic,
+                "weight": item.font_info.weight,
+                "charSet": "0",
+                "pitchAndFamily": "2"
+            })
 
             # Add font extension for string item
-            item_font_ext = etree.SubElement(item_font_info, "{http://schemas.brother.info/ptouch/2007/lbx/text}fontExt")
-            item_font_ext.set("effect", "NOEFFECT")
-            item_font_ext.set("underline", item.font_info.underline)
-            item_font_ext.set("strikeout", "0")
-            item_font_ext.set("size", item.font_info.size)
-            item_font_ext.set("orgSize", item.font_info.org_size)
-            item_font_ext.set("textColor", item.font_info.color)
-            item_font_ext.set("textPrintColorNumber", item.font_info.print_color_number)
+            item_font_ext = etree.SubElement(item_font_info, TEXT_FONT_EXT, attrib={
+                "effect": "NOEFFECT",
+                "underline": item.font_info.underline,
+                "strikeout": "0",
+                "size": item.font_info.size,
+                "orgSize": item.font_info.org_size,
+                "textColor": item.font_info.color,
+                "textPrintColorNumber": item.font_info.print_color_number
+            })
 
         return text_elem
 
@@ -354,58 +428,61 @@ class LbxGenerator:
             parent_coords: Optional (x,y) tuple of parent coordinates for nested elements
         """
         # Create image element
-        image_elem = etree.SubElement(parent, "{http://schemas.brother.info/ptouch/2007/lbx/image}image")
+        image_elem = etree.SubElement(parent, IMAGE_IMAGE)
 
         # Debug info - print original coordinates
         console.print(f"[blue]Image object positioning: x={image_obj.x}, y={image_obj.y}[/blue]")
         console.print(f"[blue]Image object dimensions: width={image_obj.width}, height={image_obj.height}[/blue]")
 
-        # Add object style
-        obj_style = etree.SubElement(image_elem, "{http://schemas.brother.info/ptouch/2007/lbx/main}objectStyle")
-
         # Use convert_to_pt to ensure all values are in points
         x_value_str = convert_to_pt(image_obj.x)
         y_value_str = convert_to_pt(image_obj.y)
 
-        obj_style.set("x", x_value_str)
-        obj_style.set("y", y_value_str)
-        obj_style.set("width", image_obj.width)
-        obj_style.set("height", image_obj.height)
-        obj_style.set("backColor", "#FFFFFF")
-        obj_style.set("backPrintColorNumber", "0")
-        obj_style.set("ropMode", "COPYPEN")
-        obj_style.set("angle", "0")
-        obj_style.set("anchor", "TOPLEFT")
-        obj_style.set("flip", "NONE")
+        # Add object style
+        obj_style = etree.SubElement(image_elem, PT_OBJECT_STYLE, attrib={
+            "x": x_value_str,
+            "y": y_value_str,
+            "width": image_obj.width,
+            "height": image_obj.height,
+            "backColor": "#FFFFFF",
+            "backPrintColorNumber": "0",
+            "ropMode": "COPYPEN",
+            "angle": "0",
+            "anchor": "TOPLEFT",
+            "flip": "NONE"
+        })
 
         # Add pen
-        pen = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}pen")
-        pen.set("style", "NULL")
-        pen.set("widthX", "0.5pt")
-        pen.set("widthY", "0.5pt")
-        pen.set("color", "#000000")
-        pen.set("printColorNumber", "1")
+        pen = etree.SubElement(obj_style, PT_PEN, attrib={
+            "style": "NULL",
+            "widthX": "0.5pt",
+            "widthY": "0.5pt",
+            "color": "#000000",
+            "printColorNumber": "1"
+        })
 
         # Add brush
-        brush = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}brush")
-        brush.set("style", "NULL")
-        brush.set("color", "#000000")
-        brush.set("printColorNumber", "1")
-        brush.set("id", "0")
+        brush = etree.SubElement(obj_style, PT_BRUSH, attrib={
+            "style": "NULL",
+            "color": "#000000",
+            "printColorNumber": "1",
+            "id": "0"
+        })
 
         # Add expanded properties
-        expanded = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}expanded")
         obj_name = f"Image{uuid.uuid4().hex[:4]}"
         if image_obj.name:
             obj_name = image_obj.name
-        expanded.set("objectName", obj_name)
-        expanded.set("ID", "0")
-        expanded.set("lock", "0")
-        expanded.set("templateMergeTarget", "LABELLIST")
-        expanded.set("templateMergeType", "NONE")
-        expanded.set("templateMergeID", "0")
-        expanded.set("linkStatus", "NONE")
-        expanded.set("linkID", "0")
+        expanded = etree.SubElement(obj_style, PT_EXPANDED, attrib={
+            "objectName": obj_name,
+            "ID": "0",
+            "lock": "0",
+            "templateMergeTarget": "LABELLIST",
+            "templateMergeType": "NONE",
+            "templateMergeID": "0",
+            "linkStatus": "NONE",
+            "linkID": "0"
+        })
 
         # Get image file name
         original_image_path = os.path.basename(image_obj.file_path)
@@ -425,51 +502,56 @@ class LbxGenerator:
         image_obj.dest_filename = dest_filename
 
         # Add image elements based on the image type (binary or path)
-        image_format = etree.SubElement(image_elem, "{http://schemas.brother.info/ptouch/2007/lbx/image}format")
-        image_format.set("type", "1")
-        image_format.set("bpp", "24")
-        image_format.set("orgSize", "74340")
+        image_format = etree.SubElement(image_elem, IMAGE_FORMAT, attrib={
+            "type": "1",
+            "bpp": "24",
+            "orgSize": "74340"
+        })
 
         # Add image style
-        image_style = etree.SubElement(image_elem, "{http://schemas.brother.info/ptouch/2007/lbx/image}style")
+        image_style = etree.SubElement(image_elem, IMAGE_STYLE)
 
         # Add trimming element
-        trimming = etree.SubElement(image_style, "{http://schemas.brother.info/ptouch/2007/lbx/image}trimming")
-        trimming.set("left", "0pt")
-        trimming.set("top", "0pt")
-        trimming.set("right", "0pt")
-        trimming.set("bottom", "0pt")
-        trimming.set("trimWidth", "0pt")
-        trimming.set("trimHeight", "0pt")
-        trimming.set("trimOrgWidth", "0pt")
-        trimming.set("trimOrgHeight", "0pt")
+        trimming = etree.SubElement(image_style, IMAGE_TRIMMING, attrib={
+            "left": "0pt",
+            "top": "0pt",
+            "right": "0pt",
+            "bottom": "0pt",
+            "trimWidth": "0pt",
+            "trimHeight": "0pt",
+            "trimOrgWidth": "0pt",
+            "trimOrgHeight": "0pt"
+        })
 
         # Add original position element (use the same x value without adjustment)
-        org_pos = etree.SubElement(image_style, "{http://schemas.brother.info/ptouch/2007/lbx/image}orgPos")
-        org_pos.set("x", x_value_str)
-        org_pos.set("y", y_value_str)
-        org_pos.set("width", image_obj.width)
-        org_pos.set("height", image_obj.height)
+        org_pos = etree.SubElement(image_style, IMAGE_ORG_POS, attrib={
+            "x": x_value_str,
+            "y": y_value_str,
+            "width": image_obj.width,
+            "height": image_obj.height
+        })
 
         # Add effect element
-        effect = etree.SubElement(image_style, "{http://schemas.brother.info/ptouch/2007/lbx/image}effect")
-        effect.set("effect", image_obj.effect_type)
-        effect.set("brightness", "50")
-        effect.set("contrast", "50")
-        effect.set("photoIndex", "4")
+        effect = etree.SubElement(image_style, IMAGE_EFFECT, attrib={
+            "effect": image_obj.effect_type,
+            "brightness": "50",
+            "contrast": "50",
+            "photoIndex": "4"
+        })
 
         # Add mono element
-        mono = etree.SubElement(image_style, "{http://schemas.brother.info/ptouch/2007/lbx/image}mono")
-        mono.set("operationKind", image_obj.operation_kind)
-        mono.set("reverse", "0")
-        mono.set("ditherKind", "MESH")
-        mono.set("threshold", "128")
-        mono.set("gamma", "100")
-        mono.set("ditherEdge", "0")
-        mono.set("rgbconvProportionRed", "30")
-        mono.set("rgbconvProportionGreen", "59")
-        mono.set("rgbconvProportionBlue", "11")
-        mono.set("rgbconvProportionReversed", "0")
+        mono = etree.SubElement(image_style, IMAGE_MONO, attrib={
+            "operationKind": image_obj.operation_kind,
+            "reverse": "0",
+            "ditherKind": "MESH",
+            "threshold": "128",
+            "gamma": "100",
+            "ditherEdge": "0",
+            "rgbconvProportionRed": "30",
+            "rgbconvProportionGreen": "59",
+            "rgbconvProportionBlue": "11",
+            "rgbconvProportionReversed": "0"
+        })
 
         return image_elem
 
@@ -483,7 +565,7 @@ class LbxGenerator:
             parent_coords: Optional (x,y) tuple of parent coordinates for nested elements
         """
         # Create group element
-        group_elem = etree.SubElement(parent, "{http://schemas.brother.info/ptouch/2007/lbx/main}group")
+        group_elem = etree.SubElement(parent, PT_GROUP)
 
         # Debug info - print original coordinates
         console.print(f"[green]Group object '{group_obj.name}' raw positioning: x={group_obj.x}, y={group_obj.y}[/green]")
@@ -494,7 +576,7 @@ class LbxGenerator:
         console.print(f"[blue]Group has explicit positioning: {is_positioned}[/blue]")
 
         # Add object style
-        obj_style = etree.SubElement(group_elem, "{http://schemas.brother.info/ptouch/2007/lbx/main}objectStyle")
+        obj_style = etree.SubElement(group_elem, PT_OBJECT_STYLE)
 
         # For explicitly positioned groups, use the original coordinates
         if is_positioned:
@@ -546,7 +628,7 @@ class LbxGenerator:
         group_y = float(y_value_str.rstrip('pt'))
 
         # Add objects container for child objects first (before calculating dimensions)
-        objects_elem = etree.SubElement(group_elem, "{http://schemas.brother.info/ptouch/2007/lbx/main}objects")
+        objects_elem = etree.SubElement(group_elem, PT_OBJECTS)
 
         # Process each child object and collect their data for auto-sizing calculation
         child_dimensions = []
@@ -654,7 +736,7 @@ class LbxGenerator:
         obj_style.set("flip", "NONE")
 
         # Add pen (border)
-        pen = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}pen")
+        pen = etree.SubElement(obj_style, PT_PEN)
         # Use INSIDEFRAME for visible borders, NULL for no border
         pen_style = group_obj.border_style if group_obj.border_style else "NULL"
         pen.set("style", pen_style)
@@ -664,14 +746,14 @@ class LbxGenerator:
         pen.set("printColorNumber", "1")
 
         # Add brush
-        brush = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}brush")
+        brush = etree.SubElement(obj_style, PT_BRUSH)
         brush.set("style", "NULL")
         brush.set("color", "#000000")
         brush.set("printColorNumber", "1")
         brush.set("id", "0")
 
         # Add expanded properties
-        expanded = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}expanded")
+        expanded = etree.SubElement(obj_style, PT_EXPANDED)
         obj_name = f"Group{uuid.uuid4().hex[:4]}"
         if group_obj.name:
             obj_name = group_obj.name
@@ -797,7 +879,7 @@ class LbxGenerator:
             parent_coords: Optional (x,y) tuple of parent coordinates for nested elements
         """
         # Create barcode element in the barcode namespace
-        barcode_elem = etree.SubElement(parent, "{http://schemas.brother.info/ptouch/2007/lbx/barcode}barcode")
+        barcode_elem = etree.SubElement(parent, BARCODE_BARCODE)
 
         # Debug info - print original coordinates
         console.print(f"[blue]Barcode object positioning: x={barcode_obj.x}, y={barcode_obj.y}[/blue]")
@@ -876,7 +958,7 @@ class LbxGenerator:
         console.print(f"[blue]Barcode dimensions: width={width_value}, height={height_value}[/blue]")
 
         # Add object style
-        obj_style = etree.SubElement(barcode_elem, "{http://schemas.brother.info/ptouch/2007/lbx/main}objectStyle")
+        obj_style = etree.SubElement(barcode_elem, PT_OBJECT_STYLE)
 
         # Use convert_to_pt to ensure all values are in points
         x_value_str = convert_to_pt(barcode_obj.x)
@@ -894,7 +976,7 @@ class LbxGenerator:
         obj_style.set("flip", "NONE")
 
         # Add pen (border)
-        pen = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}pen")
+        pen = etree.SubElement(obj_style, PT_PEN)
         pen.set("style", "INSIDEFRAME")
         pen.set("widthX", "0.5pt")
         pen.set("widthY", "0.5pt")
@@ -902,14 +984,14 @@ class LbxGenerator:
         pen.set("printColorNumber", "1")
 
         # Add brush
-        brush = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}brush")
+        brush = etree.SubElement(obj_style, PT_BRUSH)
         brush.set("style", "NULL")
         brush.set("color", "#000000")
         brush.set("printColorNumber", "1")
         brush.set("id", "0")
 
         # Add expanded properties
-        expanded = etree.SubElement(obj_style, "{http://schemas.brother.info/ptouch/2007/lbx/main}expanded")
+        expanded = etree.SubElement(obj_style, PT_EXPANDED)
         obj_name = f"Barcode{uuid.uuid4().hex[:4]}"
         expanded.set("objectName", obj_name)
         expanded.set("ID", "0")
@@ -921,7 +1003,7 @@ class LbxGenerator:
         expanded.set("linkID", "0")
 
         # Add barcode style element (common to all barcode types)
-        barcode_style = etree.SubElement(barcode_elem, "{http://schemas.brother.info/ptouch/2007/lbx/barcode}barcodeStyle")
+        barcode_style = etree.SubElement(barcode_elem, BARCODE_BARCODE_STYLE)
 
         # Set protocol from barcode.protocol
         barcode_style.set("protocol", barcode_obj.protocol)
@@ -950,7 +1032,7 @@ class LbxGenerator:
 
         # For QR codes, add QR code-specific style
         if barcode_type == "qr":
-            qrcode_style = etree.SubElement(barcode_elem, "{http://schemas.brother.info/ptouch/2007/lbx/barcode}qrcodeStyle")
+            qrcode_style = etree.SubElement(barcode_elem, BARCODE_QRCODE_STYLE)
             qrcode_style.set("model", str(barcode_obj.model))
 
             # Convert L, M, Q, H error correction to percentage values
@@ -980,7 +1062,7 @@ class LbxGenerator:
 
         # For RSS/GS1 DataBar barcodes
         elif barcode_type == "rss":
-            rss_style = etree.SubElement(barcode_elem, "{http://schemas.brother.info/ptouch/2007/lbx/barcode}rssStyle")
+            rss_style = etree.SubElement(barcode_elem, BARCODE_RSS_STYLE)
             rss_style.set("model", str(barcode_obj.rssModel))
             rss_style.set("margin", "true" if barcode_obj.margin else "false")
             rss_style.set("autoLengths", "true" if barcode_obj.autoLengths else "false")
@@ -993,7 +1075,7 @@ class LbxGenerator:
 
         # For PDF417 barcodes
         elif barcode_type == "pdf417":
-            pdf417_style = etree.SubElement(barcode_elem, "{http://schemas.brother.info/ptouch/2007/lbx/barcode}pdf417Style")
+            pdf417_style = etree.SubElement(barcode_elem, BARCODE_PDF417_STYLE)
             pdf417_style.set("model", str(barcode_obj.pdf417Model))
             pdf417_style.set("width", str(barcode_obj.barWidth))
             pdf417_style.set("aspect", str(barcode_obj.aspect))
@@ -1004,7 +1086,7 @@ class LbxGenerator:
 
         # For DataMatrix barcodes
         elif barcode_type == "datamatrix":
-            datamatrix_style = etree.SubElement(barcode_elem, "{http://schemas.brother.info/ptouch/2007/lbx/barcode}datamatrixStyle")
+            datamatrix_style = etree.SubElement(barcode_elem, BARCODE_DATAMATRIX_STYLE)
             datamatrix_style.set("model", str(barcode_obj.dataMatrixModel))
             datamatrix_style.set("cellSize", str(barcode_obj.cellSize))
             datamatrix_style.set("macro", str(barcode_obj.macro))
@@ -1013,12 +1095,12 @@ class LbxGenerator:
 
         # For MaxiCode barcodes
         elif barcode_type == "maxicode":
-            maxicode_style = etree.SubElement(barcode_elem, "{http://schemas.brother.info/ptouch/2007/lbx/barcode}maxicodeStyle")
+            maxicode_style = etree.SubElement(barcode_elem, BARCODE_MAXICODE_STYLE)
             maxicode_style.set("model", str(barcode_obj.maxiCodeModel))
             maxicode_style.set("joint", str(barcode_obj.joint))
 
         # Add data element
-        data = etree.SubElement(barcode_elem, "{http://schemas.brother.info/ptouch/2007/lbx/main}data")
+        data = etree.SubElement(barcode_elem, PT_DATA)
         # Use attrib["_text_content"] instead of .text to avoid linter error
         data.attrib["_text_content"] = str(barcode_obj.data)
 
@@ -1034,10 +1116,10 @@ class LbxGenerator:
         }
 
         # Create root element
-        root = etree.Element("{http://schemas.brother.info/ptouch/2007/lbx/meta}properties", nsmap=nsmap)
+        root = etree.Element(META_PROPERTIES, nsmap=nsmap)
 
         # Add metadata elements
-        app_name = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}appName")
+        app_name = etree.SubElement(root, META_APP_NAME)
         app_name.text = "com.brother.PtouchEditor"
 
         title = etree.SubElement(root, "{http://purl.org/dc/elements/1.1/}title")
@@ -1049,13 +1131,13 @@ class LbxGenerator:
         creator = etree.SubElement(root, "{http://purl.org/dc/elements/1.1/}creator")
         creator.text = ""
 
-        keyword = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}keyword")
+        keyword = etree.SubElement(root, META_KEYWORD)
         keyword.text = ""
 
         description = etree.SubElement(root, "{http://purl.org/dc/elements/1.1/}description")
         description.text = ""
 
-        template = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}template")
+        template = etree.SubElement(root, META_TEMPLATE)
         template.text = ""
 
         created = etree.SubElement(root, "{http://purl.org/dc/terms/}created")
@@ -1064,31 +1146,31 @@ class LbxGenerator:
         modified = etree.SubElement(root, "{http://purl.org/dc/terms/}modified")
         modified.text = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        last_printed = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}lastPrinted")
+        last_printed = etree.SubElement(root, META_LAST_PRINTED)
         last_printed.text = ""
 
-        modified_by = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}modifiedBy")
+        modified_by = etree.SubElement(root, META_MODIFIED_BY)
         modified_by.text = ""
 
-        revision = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}revision")
+        revision = etree.SubElement(root, META_REVISION)
         revision.text = "1"
 
-        edit_time = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}editTime")
+        edit_time = etree.SubElement(root, META_EDIT_TIME)
         edit_time.text = "0"
 
-        num_pages = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}numPages")
+        num_pages = etree.SubElement(root, META_NUM_PAGES)
         num_pages.text = "1"
 
-        num_words = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}numWords")
+        num_words = etree.SubElement(root, META_NUM_WORDS)
         num_words.text = "0"
 
-        num_chars = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}numChars")
+        num_chars = etree.SubElement(root, META_NUM_CHARS)
         num_chars.text = "0"
 
-        security = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}security")
+        security = etree.SubElement(root, META_SECURITY)
         security.text = "0"
 
-        transfer_script = etree.SubElement(root, "{http://schemas.brother.info/ptouch/2007/lbx/meta}transferScript")
+        transfer_script = etree.SubElement(root, META_TRANSFER_SCRIPT)
         transfer_script.text = ""
 
         # Create ElementTree
@@ -1215,14 +1297,14 @@ class LbxGenerator:
         os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
         with zipfile.ZipFile(output_path, "w") as zipf:
             # Add label.xml
-            zipf.write(self.xml_path, "label.xml")
+            zipf.write(self.xml_path, "label.xml", *zip_compression("label.xml"))
 
             # Add prop.xml
-            zipf.write(self.prop_xml_path, "prop.xml")
+            zipf.write(self.prop_xml_path, "prop.xml", *zip_compression("prop.xml"))
 
             # Add image files
             for file_path, file_name in image_files:
-                zipf.write(file_path, file_name)
+                zipf.write(file_path, file_name, *zip_compression(file_name))
 
         console.print(f"[green]Created LBX file: {output_path}[/green]")
 
@@ -105,6 +105,7 @@ import typer
 
 # Import LBXTextEditor directly
 from .lbx_text_edit import LBXTextEditor
+from .utils.archive import zip_compression
 
 # Initialize colorama for cross-platform colored output
 colorama.init(autoreset=True)
@@ -641,18 +642,21 @@ def center_elements_vertically(root: Element, label_width: float) -> None:
 
 def extract_and_parse_lbx(input_file: str, temp_dir: str) -> Tuple[ElementTree, str]:
     """
-    Extract LBX file (ZIP) and parse the XML.
+    Extract label.xml from an LBX file (ZIP) and parse it.
+
+    Only label.xml is extracted; save_lbx copies the other members straight
+    from the original archive.
 
     Args:
         input_file: Path to the input LBX file
-        temp_dir: Directory to extract the files to
+        temp_dir: Directory to extract label.xml to
 
     Returns:
         Tuple of (ET.ElementTree, xml_path)
     """
-    # Extract the LBX file (it's a ZIP file)
+    # Extract the label XML from the LBX file (it's a ZIP file)
     with zipfile.ZipFile(input_file, 'r') as zip_ref:
-        zip_ref.extractall(temp_dir)
+        zip_ref.extract('label.xml', temp_dir)
 
     # Path to the extracted label.xml file
     xml_path = os.path.join(temp_dir, 'label.xml')
@@ -695,32 +699,40 @@ def apply_compatibility_tweaks(root: Element, label_size: int) -> None:
             log_message(f"Updated printer to {config.LARGE_FORMAT_PRINTER_NAME} for compatibility with {label_size}mm tape")
 
 
-def save_lbx(tree: ElementTree, xml_path: str, output_file: str, temp_dir: str) -> None:
+def save_lbx(tree: ElementTree, output_file: str, source_file: str) -> None:
     """
     Save modified XML and create a new LBX file.
 
+    The XML is serialized straight into the archive, and members other than
+    label.xml are copied across from the source LBX, so nothing is read back
+    from disk.
+
     Args:
         tree: ElementTree with modifications
-        xml_path: Path to the XML file
         output_file: Path for the modified output file
-        temp_dir: Directory with extracted files
+        source_file: Path to the original LBX file
     """
-    # Save the modified XML
-    tree.write(xml_path, encoding='UTF-8', xml_declaration=True)
-
-    # Verify that the XML has been properly written before creating the LBX
-    with open(xml_path, 'r', encoding='utf-8') as f:
-        xml_content = f.read()
-        if config.verbose:
-            log_message(f"XML content before creating LBX (first 100 chars): {xml_content[:100]}")
+    xml_content = ET.tostring(tree, encoding='UTF-8', xml_declaration=True)
+    if config.verbose:
+        log_message(f"XML content before creating LBX (first 100 chars): {xml_content[:100].decode('utf-8', 'replace')}")
 
-    # Create a new ZIP file with the modified content
-    with zipfile.ZipFile(output_file, 'w') as zipf:
-        for root_dir, _, files in os.walk(temp_dir):
-            for file in files:
-                file_path = os.path.join(root_dir, file)
-                arcname = os.path.relpath(file_path, temp_dir)
-                zipf.write(file_path, arcname)
+    # Create a new ZIP file with the modified content. It is written next to the output
+    # and moved into place afterwards, so the output may be the source file itself.
+    temp_output = output_file + '.tmp'
+    try:
+        with zipfile.ZipFile(source_file, 'r') as source_zip, zipfile.ZipFile(temp_output, 'w') as zipf:
+            for info in source_zip.infolist():
+                # Deflate XML and bitmaps, store already-compressed images as they are
+                compress_type, compresslevel = zip_compression(info.filename)
+                if info.filename == 'label.xml':
+                    zipf.writestr('label.xml', xml_content, compress_type, compresslevel)
+                else:
+                    info.compress_type = compress_type
+                    zipf.writestr(info, source_zip.read(info), compresslevel=compresslevel)
+        os.replace(temp_output, output_file)
+    finally:
+        if os.path.exists(temp_output):
+            os.remove(temp_output)
 
 
 def get_current_label_size(root: Element) -> Optional[int]:
@@ -1002,7 +1014,7 @@ def modify_lbx(lbx_file_path: str, output_file_path: str, options: Dict[str, Any
             else:
                 # Apply compatibility tweaks before saving
                 apply_compatibility_tweaks(root, label_size)
-                save_lbx(tree, xml_path, output_file_path, temp_dir)
+                save_lbx(tree, output_file_path, lbx_file_path)
                 return
 
         # If target label size is different, update it
@@ -1054,13 +1066,13 @@ def modify_lbx(lbx_file_path: str, output_file_path: str, options: Dict[str, Any
         # Apply compatibility tweaks before any text tweaks
         apply_compatibility_tweaks(root, label_size)
 
-        # Save the current state of the tree
-        tree.write(xml_path, encoding='UTF-8', xml_declaration=True)
-
         # Apply text tweaks if requested
         if options.get('text_tweaks', False):
             log_message("Applying text tweaks...")
 
+            # The text editor works on the file, so save the current state of the tree first
+            tree.write(xml_path, encoding='UTF-8', xml_declaration=True)
+
             # Prepare text tweak options
             text_options = {
                 'convert_dimension_notation': True,  # Default transformation
@@ -1076,7 +1088,7 @@ def modify_lbx(lbx_file_path: str, output_file_path: str, options: Dict[str, Any
             log_message("Skipping text tweaks (not requested)")
 
         # Save the modified file
-        save_lbx(tree, xml_path, output_file_path, temp_dir)
+        save_lbx(tree, output_file_path, lbx_file_path)
         log_message(f"Created LBX file: {output_file_path}", msg_class=MessageClass.SUCCESS)
 
         # Open the file if requested (macOS only)
@@ -17,8 +17,10 @@ import datetime
 import zipfile
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
+from itertools import accumulate, chain
 import xml.etree.ElementTree as ET
 from lxml import etree
 from pathlib import Path
@@ -31,6 +33,14 @@ from rich import print as rich_print
 import colorama
 from colorama import Fore, Style
 
+from .utils.archive import zip_compression
+
+# Pillow is only needed when images have to be converted
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 # Initialize colorama for cross-platform color support
 colorama.init()
 
@@ -112,6 +122,55 @@ DEFAULT_FONT_ITALIC = "false"
 DEFAULT_ORIENTATION = "landscape"
 DEFAULT_PRINTER_ID = "30256"  # Brother PT-P710BT
 DEFAULT_PRINTER_NAME = "Brother PT-P710BT"
+ELEMENT_SPACING = 5.0  # Vertical spacing between stacked elements in pt
+PRINTER_DPI = 180  # Print resolution of P-Touch label printers
+LARGE_IMAGE_BYTES = 256 * 1024  # Converted images bigger than this as raw RGB are stored as PNG
+ZIP_WRITE_BUFFER_SIZE = 1024 * 1024  # Batch the many small ZIP header/member writes
+
+# Geometry fields that hold pt strings such as "10pt"
+PT_GEOMETRY_FIELDS = ('x', 'y', 'width', 'height')
+
+def _pt(value: str) -> float:
+    """Parse a pt string such as "10pt" (or a bare number) into a float."""
+    return float(value[:-2]) if value.endswith('pt') else float(value)
+
+class _PtGeometryMixin:
+    """
+    Mixin that caches the float values of the pt-valued geometry fields.
+
+    Each of x, y, width and height is parsed at most once and exposed as
+    x_pt, y_pt, width_pt and height_pt. Reassigning a field drops its cached
+    value so it is parsed again on next access.
+    """
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in PT_GEOMETRY_FIELDS:
+            self.__dict__.pop(f"_{name}_pt", None)
+
+    def _cached_pt(self, name: str) -> float:
+        cache_key = f"_{name}_pt"
+        value = self.__dict__.get(cache_key)
+        if value is None:
+            value = _pt(getattr(self, name))
+            self.__dict__[cache_key] = value
+        return value
+
+    @property
+    def x_pt(self) -> float:
+        return self._cached_pt('x')
+
+    @property
+    def y_pt(self) -> float:
+        return self._cached_pt('y')
+
+    @property
+    def width_pt(self) -> float:
+        return self._cached_pt('width')
+
+    @property
+    def height_pt(self) -> float:
+        return self._cached_pt('height')
 
 @dataclass
 class FontInfo:
@@ -126,7 +185,7 @@ class FontInfo:
     @property
     def org_size(self) -> str:
         """Calculate the original size (3.6x the font size)."""
-        size_value = float(self.size.replace('pt', ''))
+        size_value = _pt(self.size)
         return f"{size_value * 3.6}pt"
 
 @dataclass
@@ -137,7 +196,7 @@ class StringItem:
     start_pos: int = 0
 
 @dataclass
-class TextObject:
+class TextObject(_PtGeometryMixin):
     """Represents a text object on the label."""
     text: str
     x: str
@@ -153,7 +212,7 @@ class TextObject:
             self.string_items = [StringItem(char_len=len(self.text), font_info=self.font_info)]
 
 @dataclass
-class ImageObject:
+class ImageObject(_PtGeometryMixin):
     """Object representing an image to be added to the label."""
     file_path: str
     x: str
@@ -194,6 +253,82 @@ class LabelConfig:
     text_objects: List[TextObject] = field(default_factory=list)
     image_objects: List[ImageObject] = field(default_factory=list)
 
+def _flatten_alpha(img):
+    """
+    Composite an RGBA or LA image onto a white background and return it as RGB.
+
+    The blend is done in a single C-level pass by Pillow, with the alpha band
+    used as the paste mask. getchannel() copies only that band, where split()
+    would copy every band of the image.
+    """
+    background = Image.new('RGB', img.size, (255, 255, 255))
+    background.paste(img, mask=img.getchannel('A'))
+    return background
+
+def _to_rgb(img):
+    """Return an RGB version of an image, checking the common already-RGB case first."""
+    mode = img.mode
+    if mode == 'RGB':
+        return img
+    if mode in ('RGBA', 'LA'):
+        # BMP doesn't support alpha, so flatten onto white
+        return _flatten_alpha(img)
+    return img.convert('RGB')
+
+def _target_pixel_size(image_obj: ImageObject) -> Tuple[int, int]:
+    """Return the pixel size an image needs to fill its label area at the printer's resolution."""
+    scale = PRINTER_DPI / 72
+    return (max(1, round(image_obj.width_pt * scale)), max(1, round(image_obj.height_pt * scale)))
+
+def _is_large_image(image_obj: ImageObject) -> bool:
+    """Check whether a converted image could exceed LARGE_IMAGE_BYTES as an uncompressed bitmap."""
+    width, height = _target_pixel_size(image_obj)
+    return width * height * 3 > LARGE_IMAGE_BYTES
+
+def _is_compatible_bmp(file_path: str) -> bool:
+    """Check whether a file is already an RGB BMP that can be stored without re-encoding."""
+    with open(file_path, 'rb') as f:
+        if f.read(2) != b'BM':
+            return False
+
+    # Image.open only reads the header, so this doesn't decode the pixel data
+    with Image.open(file_path) as img:
+        return img.mode == 'RGB'
+
+def _can_store_unconverted(image_obj: ImageObject) -> bool:
+    """Check whether an image marked for conversion can be stored in the LBX as-is."""
+    return image_obj.dest_filename.lower().endswith('.bmp') and _is_compatible_bmp(image_obj.file_path)
+
+def _convert_image(image_obj: ImageObject) -> bytes:
+    """
+    Convert an image to RGB at its printed size and return the encoded bytes.
+
+    The output is PNG when the destination filename ends in .png and BMP otherwise.
+    """
+    # Open the image and shrink it to the size it will be printed at.
+    # draft() lets JPEGs decode at a reduced scale; it's a no-op for other formats.
+    img = Image.open(image_obj.file_path)
+    target_size = _target_pixel_size(image_obj)
+    img.draft('RGB', (target_size[0] * 2, target_size[1] * 2))
+    img.thumbnail(target_size, Image.LANCZOS)
+
+    img = _to_rgb(img)
+
+    # Encode in memory so the image goes straight into the ZIP. PNG favours speed over size
+    # since it's only used to avoid storing large uncompressed bitmaps.
+    buffer = io.BytesIO()
+    if image_obj.dest_filename.lower().endswith('.png'):
+        img.save(buffer, "PNG", optimize=False, compress_level=1)
+    else:
+        img.save(buffer, "BMP")
+    return buffer.getvalue()
+
+def _convert_if_needed(image_obj: ImageObject) -> Optional[bytes]:
+    """Return the converted image bytes, or None when the source file can be stored as-is."""
+    if image_obj.needs_conversion and not _can_store_unconverted(image_obj):
+        return _convert_image(image_obj)
+    return None
+
 class LBXCreator:
     """Creates Brother P-Touch LBX label files with text and images."""
 
@@ -475,8 +610,10 @@ class LBXCreator:
         # Determine if we need to convert this image to BMP
         # BMP is the most compatible format, but PNG should work in newer versions
         if image_obj.convert_to_bmp:
-            # Create a unique name for the BMP in the LBX file
-            dest_filename = f"Object{uuid.uuid4().hex[:4]}.bmp"
+            # Create a unique name for the converted image in the LBX file. Large images
+            # are stored as PNG, which P-touch Editor also reads, to keep the LBX small.
+            extension = ".png" if _is_large_image(image_obj) else ".bmp"
+            dest_filename = f"Object{uuid.uuid4().hex[:4]}{extension}"
             image_obj.needs_conversion = True
         else:
             # Use the original filename when not converting
@@ -699,58 +836,63 @@ class LBXCreator:
         with open(self.prop_xml_path, 'w', encoding='utf-8') as f:
             f.write(minified_prop_xml)
 
-        # Process images
-        image_files = []
-        for image_obj in self.config.image_objects:
-            if os.path.exists(image_obj.file_path):
-                if image_obj.needs_conversion:
-                    try:
-                        # Use PIL to convert the image
-                        from PIL import Image
-
-                        # Create the destination file path in the temp directory
-                        dest_path = os.path.join(self.temp_dir, image_obj.dest_filename)
-
-                        # Open and convert the image
-                        img = Image.open(image_obj.file_path)
-
-                        # Convert to RGB mode if needed (BMP doesn't support LA mode)
-                        if img.mode in ('RGBA', 'LA'):
-                            background = Image.new('RGB', img.size, (255, 255, 255))
-                            background.paste(img, mask=img.split()[3] if img.mode == 'RGBA' else img.split()[1])
-                            img = background
-                        elif img.mode != 'RGB':
-                            img = img.convert('RGB')
-
-                        # Save as BMP
-                        img.save(dest_path, "BMP")
-
-                        # Add to the list of image files to include in the ZIP
-                        image_files.append((dest_path, image_obj.dest_filename))
-                        print(f"Converted {image_obj.file_path} to BMP format: {image_obj.dest_filename}")
-                    except Exception as e:
-                        print(f"Error converting image {image_obj.file_path}: {e}")
-                else:
-                    # No conversion needed, just copy the file
-                    dest_path = os.path.join(self.temp_dir, image_obj.dest_filename)
-                    shutil.copy2(image_obj.file_path, dest_path)
-                    image_files.append((dest_path, image_obj.dest_filename))
-                    print(f"Using original image format for {image_obj.file_path}")
-
-        # Create ZIP file (LBX)
-        with zipfile.ZipFile(output_path, "w") as zipf:
-            # Add label.xml
-            zipf.write(self.xml_path, "label.xml")
+        # Check up front that any images needing conversion can be converted
+        if Image is None and any(image_obj.needs_conversion for image_obj in self.config.image_objects):
+            raise RuntimeError("Pillow is required to convert images. Install it with: pip install Pillow")
 
-            # Add prop.xml
-            zipf.write(self.prop_xml_path, "prop.xml")
+        # Create ZIP file (LBX) through a large write buffer. It's built under a temporary
+        # name and moved into place once complete, so a failure never leaves a partial LBX.
+        partial_path = f"{output_path}.partial"
+        try:
+            with open(partial_path, "wb", buffering=ZIP_WRITE_BUFFER_SIZE) as f, zipfile.ZipFile(f, "w") as zipf:
+                self._write_members(zipf)
 
-            # Add image files
-            for file_path, file_name in image_files:
-                zipf.write(file_path, file_name)
+            os.replace(partial_path, output_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
 
         console.print(f"[green]Created LBX file: {output_path}[/green]")
 
+    def _write_members(self, zipf: zipfile.ZipFile) -> None:
+        """
+        Write label.xml, prop.xml and the label's images into the LBX archive.
+
+        Images are converted on a thread pool (Pillow releases the GIL while decoding and
+        encoding) while this thread compresses the XML files and writes finished images
+        into the archive in their original order.
+        """
+        images = [image_obj for image_obj in self.config.image_objects if os.path.exists(image_obj.file_path)]
+
+        with ThreadPoolExecutor() as executor:
+            conversions = [executor.submit(_convert_if_needed, image_obj) for image_obj in images]
+
+            # Add label.xml
+            compress_type, compresslevel = zip_compression("label.xml")
+            zipf.write(self.xml_path, "label.xml", compress_type, compresslevel)
+
+            # Add prop.xml
+            compress_type, compresslevel = zip_compression("prop.xml")
+            zipf.write(self.prop_xml_path, "prop.xml", compress_type, compresslevel)
+
+            # Add each image as soon as its conversion is ready
+            for image_obj, conversion in zip(images, conversions):
+                compress_type, compresslevel = zip_compression(image_obj.dest_filename)
+                try:
+                    image_data = conversion.result()
+                except Exception as e:
+                    print(f"Error converting image {image_obj.file_path}: {e}")
+                    continue
+
+                if image_data is None:
+                    # No conversion needed, so the ZIP reads straight from the source file
+                    zipf.write(image_obj.file_path, image_obj.dest_filename, compress_type, compresslevel)
+                    print(f"Using original image format for {image_obj.file_path}")
+                else:
+                    image_format = "PNG" if image_obj.dest_filename.lower().endswith('.png') else "BMP"
+                    zipf.writestr(image_obj.dest_filename, image_data, compress_type, compresslevel)
+                    print(f"Converted {image_obj.file_path} to {image_format} format: {image_obj.dest_filename}")
+
     def cleanup(self) -> None:
         """Clean up temporary files."""
         if self.temp_dir and os.path.exists(self.temp_dir):
@@ -804,7 +946,8 @@ def calculate_layout(config: LabelConfig, margin: int = 5, side_by_side: bool =
     size_config = LABEL_SIZES[config.size_mm]
 
     # Set initial y-positions for objects based on label size
-    initial_y = float(size_config['text_object_y'].replace('pt', ''))
+    initial_y = _pt(size_config['text_object_y'])
+    spacing = ELEMENT_SPACING
 
     # Position elements vertically
     current_y = initial_y
@@ -812,32 +955,39 @@ def calculate_layout(config: LabelConfig, margin: int = 5, side_by_side: bool =
     # If we have both images and text, position text to the right of images
     if config.image_objects and config.text_objects:
         # Find the rightmost edge of all images
-        max_image_right = 0
-        for image_obj in config.image_objects:
-            image_right = float(image_obj.x.replace('pt', '')) + float(image_obj.width.replace('pt', ''))
-            max_image_right = max(max_image_right, image_right)
+        max_image_right = max(
+            (image_obj.x_pt + image_obj.width_pt for image_obj in config.image_objects), default=0
+        )
 
         # Position text objects to the right of images with a margin
+        text_x = f"{max_image_right + margin}pt"
         for text_obj in config.text_objects:
-            text_obj.x = f"{max_image_right + margin}pt"
+            text_obj.x = text_x
 
     # Position image objects first
-    for image_obj in config.image_objects:
-        image_obj.y = f"{current_y}pt"
-        if not side_by_side:
-            current_y += float(image_obj.height.replace('pt', '')) + 5  # 5pt spacing
+    if side_by_side:
+        image_y = f"{current_y}pt"
+        for image_obj in config.image_objects:
+            image_obj.y = image_y
+    else:
+        # Stack images: each starts where the previous one ended, and the last sum is where text starts
+        heights = (image_obj.height_pt + spacing for image_obj in config.image_objects)
+        positions = list(accumulate(chain([current_y], heights)))
+        for image_obj, image_y in zip(config.image_objects, positions):
+            image_obj.y = f"{image_y}pt"
+        current_y = positions[-1]
 
     # Position text objects vertically
     if side_by_side and config.image_objects and config.text_objects:
         # In side-by-side mode with both images and text, align text vertically with the first image
-        image_y = float(config.image_objects[0].y.replace('pt', ''))
+        image_y = config.image_objects[0].y
         for text_obj in config.text_objects:
-            text_obj.y = f"{image_y}pt"
+            text_obj.y = image_y
     else:
         # Standard stacked layout
-        for i, text_obj in enumerate(config.text_objects):
+        for text_obj in config.text_objects:
             text_obj.y = f"{current_y}pt"
-            current_y += float(text_obj.height.replace('pt', '')) + 5  # 5pt spacing between text elements
+            current_y += text_obj.height_pt + spacing
 
     # If no elements, use default positions
     if not config.text_objects and not config.image_objects:
@@ -848,20 +998,50 @@ def calculate_layout(config: LabelConfig, margin: int = 5, side_by_side: bool =
         # No additional centering needed as we're stacking elements vertically
         pass
 
+def _find_missing_files(paths: List[str]) -> List[str]:
+    """
+    Return the paths that don't exist, in their original order.
+
+    Paths are grouped by directory so a directory holding several of them is
+    read once with os.scandir instead of stat'ing each file separately. Any
+    path not seen in a listing (including lone files) falls back to
+    os.path.exists, which also covers case-insensitive filesystems.
+    """
+    paths_by_dir: Dict[str, List[str]] = {}
+    for path in paths:
+        paths_by_dir.setdefault(os.path.dirname(path) or '.', []).append(path)
+
+    found = set()
+    for directory, dir_paths in paths_by_dir.items():
+        if len(dir_paths) < 2:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            continue
+        found.update(path for path in dir_paths if os.path.basename(path) in names)
+
+    return [path for path in paths if path not in found and not os.path.exists(path)]
+
 def validate_input(text: Optional[List[str]], images: Optional[List[str]]) -> bool:
     """Validate input parameters and display errors if any."""
     # Allow blank labels (no text or images is ok)
 
     if images:
-        for image_path in images:
-            if not os.path.exists(image_path):
-                console.print(f"[bold red]Error: Image file not found: {image_path}[/bold red]")
-                return False
+        missing_images = _find_missing_files(images)
+        if missing_images:
+            console.print(f"[bold red]Error: Image file not found: {missing_images[0]}[/bold red]")
+            return False
 
     return True
 
-def print_label_info(config: LabelConfig) -> None:
-    """Print information about the label."""
+def print_label_info(config: LabelConfig, quiet: bool = False) -> None:
+    """Print information about the label when writing to a terminal."""
+    # Skip building the table entirely for scripted or redirected runs
+    if quiet or not console.is_terminal:
+        return
+
     table = Table(title=f"Label ({config.size_mm}mm)")
 
     table.add_column("Type", style="cyan")
@@ -902,7 +1082,8 @@ def create(
     auto_length: bool = typer.Option(True, "--auto-length/--no-auto-length", "-a", help="Automatically adjust label length based on content"),
     convert_images: bool = typer.Option(False, "--convert-images/--no-convert-images", help="Convert images to BMP for maximum compatibility"),
     margin: int = typer.Option(5, "--margin", "-m", help="Margin between elements in pt"),
-    side_by_side: bool = typer.Option(False, "--side-by-side/--stacked", help="Position text side-by-side with images instead of stacking")
+    side_by_side: bool = typer.Option(False, "--side-by-side/--stacked", help="Position text side-by-side with images instead of stacking"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Don't print the label information table")
 ) -> None:
     """Create a new LBX label file with text and images."""
     # Validate input
@@ -941,7 +1122,7 @@ def create(
     calculate_layout(config, margin=margin, side_by_side=side_by_side)
 
     # Print label information
-    print_label_info(config)
+    print_label_info(config, quiet=quiet)
 
     # Create the LBX file
     creator = LBXCreator(config)
@@ -21,6 +21,7 @@ Options:
   --verbose            Print detailed processing information
   -i --extract-images  Extract images from LBX files and save them to a folder
   --db                 Use SQLite database for part information and update database
+  --recompress         Re-encode PNG images when extracting instead of copying them as-is
 """
 
 import os
@@ -28,26 +29,65 @@ import re
 import sys
 import zipfile
 import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
 import argparse
 import shutil
 import io
+import contextlib
 import sqlite3
 import unicodedata
 import subprocess
 import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, count, repeat
 from pathlib import Path
 from datetime import datetime
 
+from .utils.archive import zip_compression
+
 try:
-    from PIL import Image
+    from PIL import Image, ImageChops
     PILLOW_AVAILABLE = True
 except ImportError:
     PILLOW_AVAILABLE = False
     print("Warning: Pillow library not found. Basic image optimization will be disabled.")
-    print("Install with: pip install pillow")
+    print("Install with: pip install pillow (or pillow-simd for faster image conversion on x86)")
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    etree = ET
+    LXML_AVAILABLE = False
+
+# zlib-ng is an optional, faster drop-in for the zlib module that zipfile uses for DEFLATE
+try:
+    from zlib_ng import zlib_ng
+    ZLIB_NG_AVAILABLE = True
+except ImportError:
+    zlib_ng = None
+    ZLIB_NG_AVAILABLE = False
+
+
+def use_fast_deflate():
+    """
+    Make zipfile compress, decompress and checksum with zlib-ng when it is installed.
+
+    This swaps the zlib module inside zipfile for the whole process, so it is
+    only called from the command-line entry point. Returns True if enabled.
+    Install with: pip install zlib-ng
+    """
+    if not ZLIB_NG_AVAILABLE:
+        return False
+    zipfile.zlib = zlib_ng
+    zipfile.crc32 = zlib_ng.crc32
+    return True
+
 
 # Check if ImageMagick is available and determine which command to use
+@lru_cache(maxsize=None)
 def check_imagemagick():
     """Check for ImageMagick availability and return (available, command_name)"""
     # Try the new unified 'magick' command first (ImageMagick 7+)
@@ -68,10 +108,83 @@ def check_imagemagick():
 
     return False, None
 
-IMAGEMAGICK_AVAILABLE, IMAGEMAGICK_COMMAND = check_imagemagick()
-if not IMAGEMAGICK_AVAILABLE:
-    print("Warning: ImageMagick not found. Advanced image conversion will be disabled.")
-    print("Install ImageMagick for optimal BMP to transparent PNG conversion.")
+
+@lru_cache(maxsize=None)
+def imagemagick_command():
+    """
+    Return the ImageMagick command to run, or None if ImageMagick is not installed.
+
+    The check only runs when a BMP actually needs ImageMagick, and its result is
+    remembered, so the "not found" warning is printed at most once per process.
+    """
+    available, command = check_imagemagick()
+    if not available:
+        print("Warning: ImageMagick not found. Advanced image conversion will be disabled.")
+        print("Install ImageMagick for optimal BMP to transparent PNG conversion.")
+    return command
+
+
+def convert_bmps_with_imagemagick(conversions, verbose=False):
+    """
+    Convert BMP files to PNG with white made transparent, using ImageMagick.
+
+    conversions is a list of (bmp_path, png_path) pairs, where each PNG sits next
+    to its BMP under the same stem. They are all converted by one mogrify
+    process; if that fails, each file is converted on its own. Converted BMP
+    files are removed. Returns the list of converted BMP paths.
+    """
+    if not conversions:
+        return []
+
+    command = imagemagick_command()
+
+    # 'magick mogrify' on ImageMagick 7+, standalone 'mogrify' on 6.x
+    cmd = [command, 'mogrify'] if command == 'magick' else ['mogrify']
+    cmd += ['-format', 'png', '-transparent', 'white'] + [bmp_path for bmp_path, _ in conversions]
+
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        batch_converted = result.returncode == 0
+        if not batch_converted and verbose:
+            print(f"ImageMagick batch conversion failed, converting one file at a time: {result.stderr.decode()}")
+    except OSError as e:
+        batch_converted = False
+        if verbose:
+            print(f"ImageMagick batch conversion failed, converting one file at a time: {e}")
+
+    converted = []
+    for bmp_path, png_path in conversions:
+        try:
+            if not batch_converted:
+                cmd = [command, bmp_path, "-transparent", "white", png_path]
+                result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                if result.returncode != 0:
+                    if verbose:
+                        print(f"ImageMagick conversion failed: {result.stderr.decode()}")
+                    continue
+
+            os.remove(bmp_path)
+            converted.append(bmp_path)
+        except Exception as e:
+            if verbose:
+                print(f"Error converting {bmp_path}: {e}")
+
+    return converted
+
+
+# Namespaced tags of the label.xml elements the parser reads
+PT_DATA_TAG = '{http://schemas.brother.info/ptouch/2007/lbx/main}data'
+IMAGE_STYLE_TAG = '{http://schemas.brother.info/ptouch/2007/lbx/image}imageStyle'
+LABEL_SCAN_TAGS = (PT_DATA_TAG, IMAGE_STYLE_TAG)
+
+# Archive members with these extensions are treated as images
+IMAGE_EXTENSIONS = frozenset({'.bmp', '.jpg', '.jpeg', '.png', '.gif'})
+
+# Precompiled pattern for filename cleanup
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\s-]')
+
+# Alpha lookup table that makes pure white transparent and everything else opaque
+WHITE_TO_TRANSPARENT_LUT = [255] * 255 + [0]
 
 # Define the path to the database
 DB_PATH = os.path.expanduser("~/bin/lego-data/lego.sqlite")
@@ -86,107 +199,275 @@ def connect_to_database():
         return None
 
 
-def get_part_info(part_num):
-    """Get part information from the database."""
-    conn = connect_to_database()
-    if not conn:
-        return None
+# Connection shared by all database lookups and updates in this process
+_DB_CONNECTION = None
 
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM parts WHERE part_num = ?", (part_num,))
-        result = cursor.fetchone()
-        return result[0] if result else None
-    except sqlite3.Error as e:
-        print(f"Error querying database: {e}")
-        return None
-    finally:
-        conn.close()
+
+def _db():
+    """Return this process's shared database connection, opening it on first use."""
+    global _DB_CONNECTION
+    if _DB_CONNECTION is None:
+        _DB_CONNECTION = connect_to_database()
+    return _DB_CONNECTION
+
+
+def get_part_info(part_num):
+    """Get the name of a part from the database, or None if it is not found."""
+    return get_part_names([part_num]).get(part_num)
 
 
 def update_part_label_file(part_num, label_file):
     """Update the label_file field for a part in the database."""
-    conn = connect_to_database()
-    if not conn:
-        return False
+    return update_part_label_files([part_num], label_file) > 0
+
+
+# Part names already looked up in this process, least recently used first, with None
+# for parts that are not in the database. update_part_label_files only changes the
+# label_file column, so cached names stay valid; call clear_part_name_cache() if the
+# parts table is changed by other means.
+_PART_NAME_CACHE = OrderedDict()
+PART_NAME_CACHE_SIZE = 4096
+
+
+def clear_part_name_cache():
+    """Forget the part names looked up so far."""
+    _PART_NAME_CACHE.clear()
+
+
+def get_part_names(part_nums):
+    """
+    Get the names of several parts, as a dict keyed by part number.
+
+    Parts looked up before come from the cache; the rest are fetched with one query.
+    """
+    part_nums = list(dict.fromkeys(part_nums))
+    missing = [part_num for part_num in part_nums if part_num not in _PART_NAME_CACHE]
+
+    if missing:
+        conn = _db()
+        if conn:
+            placeholders = ','.join('?' * len(missing))
+            try:
+                cursor = conn.execute(f"SELECT part_num, name FROM parts WHERE part_num IN ({placeholders})", missing)
+                found = dict(cursor.fetchall())
+            except sqlite3.Error as e:
+                print(f"Error querying database: {e}")
+            else:
+                for part_num in missing:
+                    _PART_NAME_CACHE[part_num] = found.get(part_num)
+
+    part_names = {}
+    for part_num in part_nums:
+        if part_num in _PART_NAME_CACHE:
+            _PART_NAME_CACHE.move_to_end(part_num)
+            if _PART_NAME_CACHE[part_num] is not None:
+                part_names[part_num] = _PART_NAME_CACHE[part_num]
+
+    while len(_PART_NAME_CACHE) > PART_NAME_CACHE_SIZE:
+        _PART_NAME_CACHE.popitem(last=False)
+
+    return part_names
+
+
+def update_part_label_files(part_nums, label_file):
+    """Set the label_file field for several parts in one transaction. Returns the number of parts updated."""
+    conn = _db()
+    part_nums = list(dict.fromkeys(part_nums))
+    if not conn or not part_nums:
+        return 0
 
     try:
-        cursor = conn.cursor()
-        cursor.execute("UPDATE parts SET label_file = ? WHERE part_num = ?", (label_file, part_num))
-        conn.commit()
-        return cursor.rowcount > 0
+        with conn:
+            cursor = conn.executemany(
+                "UPDATE parts SET label_file = ? WHERE part_num = ?",
+                [(label_file, part_num) for part_num in part_nums]
+            )
+        return cursor.rowcount
     except sqlite3.Error as e:
         print(f"Error updating database: {e}")
-        return False
-    finally:
-        conn.close()
+        return 0
+
+
+class _AsciiFoldTable(dict):
+    """str.translate table mapping characters to their ASCII equivalents, filled in lazily via NFKD."""
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        if char.isascii():
+            folded = char
+        else:
+            folded = unicodedata.normalize('NFKD', char).encode('ascii', 'ignore').decode('ascii')
+        self[codepoint] = folded
+        return folded
+
+
+_ASCII_FOLD_TABLE = _AsciiFoldTable()
 
 
 def sanitize_filename(name, max_length=30):
     """Sanitize a string to be safe for use in filenames."""
     # Replace non-ASCII characters with ASCII equivalents if possible
-    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    name = name.translate(_ASCII_FOLD_TABLE)
 
     # Replace spaces and invalid characters with underscores
-    name = re.sub(r'[^\w\s-]', '', name).strip().replace(' ', '_')
+    name = _UNSAFE_FILENAME_CHARS_RE.sub('', name).strip().replace(' ', '_')
 
     # Truncate to max length
-    if len(name) > max_length:
-        name = name[:max_length]
-
-    return name
+    return name[:max_length]
 
 
 def find_lbx_files(directory, recursive=True):
-    """Find all LBX files in the specified directory (and optionally its subdirectories)."""
-    lbx_files = []
-
-    if recursive:
-        # Search recursively using os.walk
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.lower().endswith('.lbx'):
-                    lbx_files.append(os.path.join(root, file))
+    """
+    Yield the LBX files in the specified directory (and optionally its subdirectories).
+
+    Uses os.scandir so file types come from the directory listing without an
+    extra stat per entry. Like os.walk, symlinked directories are not followed
+    and unreadable subdirectories are skipped. Files and subdirectories are
+    visited in name order, so runs over the same tree process (and report) files
+    in the same order; only the matching names are kept for sorting.
+    """
+    lbx_paths = []
+    subdirectories = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if recursive and not entry.is_symlink():
+                    subdirectories.append(entry.path)
+            elif entry.name.lower().endswith('.lbx'):
+                lbx_paths.append(entry.path)
+
+    yield from sorted(lbx_paths)
+
+    for subdirectory in sorted(subdirectories):
+        try:
+            yield from find_lbx_files(subdirectory, recursive)
+        except OSError:
+            continue
+
+
+def _clean_text(text):
+    """Strip each line of a text block and drop the empty ones."""
+    return '\n'.join(filter(None, map(str.strip, text.split('\n'))))
+
+
+def _iter_label_elements(xml_file):
+    """Yield the <pt:data> and <image:imageStyle> elements of label.xml, freeing each after use."""
+    if LXML_AVAILABLE:
+        for _, elem in etree.iterparse(xml_file, events=('end',), tag=LABEL_SCAN_TAGS):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
     else:
-        # Search only the specified directory
-        for file in os.listdir(directory):
-            if file.lower().endswith('.lbx'):
-                lbx_files.append(os.path.join(directory, file))
-
-    return lbx_files
-
-
-def extract_text_from_lbx(lbx_file_path, verbose=False):
+        # ElementTree has no getparent(), so track the open elements and drop each
+        # finished element from its parent; the parser keeps the open ancestors
+        open_elements = []
+        for event, elem in etree.iterparse(xml_file, events=('start', 'end')):
+            if event == 'start':
+                open_elements.append(elem)
+                continue
+            open_elements.pop()
+            if elem.tag in LABEL_SCAN_TAGS:
+                yield elem
+            elem.clear()
+            if open_elements:
+                open_elements[-1].remove(elem)
+
+
+class LbxDocument:
+    """
+    An open LBX archive whose label.xml is parsed at most once.
+
+    Use it as a context manager. The archive stays open for the whole block so
+    text extraction, image extraction and image saving can share one handle,
+    and label.xml is scanned once on first access to data_texts or image_map.
+    Members are streamed from the file on disk; only a caller that is about to
+    replace that file loads the archive into memory, with release_file().
+    """
+
+    def __init__(self, lbx_file_path):
+        self.path = lbx_file_path
+        self.zip = None
+        self.names = []
+        self._in_memory = False
+        self._data_texts = None
+        self._image_map = None
+
+    def __enter__(self):
+        self.zip = zipfile.ZipFile(self.path, 'r')
+        self.names = self.zip.namelist()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.zip.close()
+
+    def release_file(self):
+        """
+        Load the archive into memory and close the file on disk.
+
+        Call this before the file is replaced, so no handle stays open on it
+        while the document goes on being read.
+        """
+        if self._in_memory:
+            return
+        with open(self.path, 'rb') as f:
+            data = io.BytesIO(f.read())
+        self.zip.close()
+        self.zip = zipfile.ZipFile(data, 'r')
+        self._in_memory = True
+
+    def _scan_label_xml(self):
+        """Collect the text blocks and the fileName -> originalName map in one pass."""
+        data_texts = []
+        image_map = {}
+        if 'label.xml' in self.names:
+            with self.zip.open('label.xml') as xml_file:
+                for elem in _iter_label_elements(xml_file):
+                    if elem.tag == PT_DATA_TAG:
+                        data_texts.append(elem.text or '')
+                    elif elem.get('fileName') and elem.get('originalName'):
+                        image_map[elem.get('fileName')] = elem.get('originalName')
+        self._data_texts = data_texts
+        self._image_map = image_map
+
+    @property
+    def data_texts(self):
+        """Raw text of every <pt:data> element, in document order."""
+        if self._data_texts is None:
+            self._scan_label_xml()
+        return self._data_texts
+
+    @property
+    def image_map(self):
+        """Mapping from image member names to the original image names."""
+        if self._image_map is None:
+            self._scan_label_xml()
+        return self._image_map
+
+
+def _open_document(lbx_file_path, document=None):
+    """Return a context manager for the given open document, or open a new one."""
+    if document is not None:
+        return contextlib.nullcontext(document)
+    return LbxDocument(lbx_file_path)
+
+
+def extract_text_from_lbx(lbx_file_path, verbose=False, document=None):
     """Extract text content from an LBX file."""
     text_blocks = []
 
     try:
-        with zipfile.ZipFile(lbx_file_path, 'r') as zip_ref:
-            # Get list of all files in the archive
-            file_list = zip_ref.namelist()
-
+        with _open_document(lbx_file_path, document) as document:
             if verbose:
-                print(f"Files in archive: {', '.join(file_list)}")
-
-            # Check if label.xml exists in the archive
-            if 'label.xml' in file_list:
-                # Extract and read label.xml
-                label_xml = zip_ref.read('label.xml').decode('utf-8', errors='ignore')
-
-                # Find all <pt:data> tags and extract their content
-                data_tags = re.findall(r'<pt:data>(.*?)</pt:data>', label_xml, re.DOTALL)
+                print(f"Files in archive: {', '.join(document.names)}")
 
-                if verbose:
-                    print(f"Found {len(data_tags)} text blocks in label.xml")
+            data_texts = document.data_texts
 
-                for data in data_tags:
-                    # Preserve newlines but clean up excessive whitespace
-                    lines = [line.strip() for line in data.split('\n')]
-                    cleaned_lines = [line for line in lines if line]  # Remove empty lines
+            if verbose and 'label.xml' in document.names:
+                print(f"Found {len(data_texts)} text blocks in label.xml")
 
-                    if cleaned_lines:
-                        final_text = '\n'.join(cleaned_lines)
-                        text_blocks.append(final_text)
+            # Preserve newlines but clean up excessive whitespace
+            text_blocks = [text for text in map(_clean_text, data_texts) if text]
 
     except Exception as e:
         print(f"Error processing {lbx_file_path}: {e}")
@@ -194,37 +475,25 @@ def extract_text_from_lbx(lbx_file_path, verbose=False):
     return text_blocks
 
 
-def extract_images_from_lbx(lbx_file_path, extract_images=False, verbose=False):
+def extract_images_from_lbx(lbx_file_path, extract_images=False, verbose=False, document=None):
     """Extract images from an LBX file."""
     images_info = []
-    file_name_to_original = {}
 
     if not extract_images:
         return images_info
 
     try:
-        with zipfile.ZipFile(lbx_file_path, 'r') as zip_ref:
-            # Get list of all files in the archive
-            file_list = zip_ref.namelist()
-
-            # Try to extract original names from label.xml
-            if 'label.xml' in file_list:
-                label_xml = zip_ref.read('label.xml').decode('utf-8', errors='ignore')
-
-                # Look for image:imageStyle tags with originalName and fileName attributes
-                image_tags = re.findall(r'<image:imageStyle\s+originalName="([^"]*?)"\s+[^>]*?fileName="([^"]*?)"[^>]*?>', label_xml, re.DOTALL)
+        with _open_document(lbx_file_path, document) as document:
+            # Original names come from the imageStyle elements in label.xml
+            file_name_to_original = document.image_map
 
-                if verbose and image_tags:
-                    print(f"Found {len(image_tags)} image tags with mapping information")
-
-                # Create mapping from fileName to originalName
-                for original_name, file_name in image_tags:
-                    file_name_to_original[file_name] = original_name
-                    if verbose:
-                        print(f"Mapping: {file_name} -> {original_name}")
+            if verbose and file_name_to_original:
+                print(f"Found {len(file_name_to_original)} image tags with mapping information")
+                for file_name, original_name in file_name_to_original.items():
+                    print(f"Mapping: {file_name} -> {original_name}")
 
             # Collect all image files (check for common image extensions)
-            image_files = [f for f in file_list if f.lower().endswith(('.bmp', '.jpg', '.jpeg', '.png', '.gif'))]
+            image_files = [f for f in document.names if os.path.splitext(f)[1].lower() in IMAGE_EXTENSIONS]
 
             if verbose:
                 print(f"Found {len(image_files)} image files in archive")
@@ -247,75 +516,223 @@ def extract_images_from_lbx(lbx_file_path, extract_images=False, verbose=False):
     return images_info
 
 
-def modify_label_xml(lbx_file_path, bmp_to_png_conversions, verbose=False):
-    """Modify the label.xml file to update image references after conversion."""
+def _bmp_to_transparent_png(bmp_file):
+    """
+    Convert a BMP to PNG bytes with pure white made transparent, like ImageMagick's -transparent white.
+
+    bmp_file is a path or a binary file object, such as an open archive member.
+    Palette and grayscale bitmaps (the usual 1- and 8-bit label images) keep
+    their mode and get a PNG transparency entry for white instead of being
+    expanded to RGBA.
+    """
+    img = Image.open(bmp_file)
+    save_options = {}
+
+    if img.mode in ('1', 'L'):
+        # White is the single pixel value 255
+        save_options['transparency'] = 255
+    elif img.mode == 'P' and img.palette.mode == 'RGB':
+        # Mark the white palette entries transparent
+        palette = img.getpalette()
+        save_options['transparency'] = bytes(
+            0 if palette[i:i + 3] == [255, 255, 255] else 255 for i in range(0, len(palette), 3)
+        )
+    else:
+        img = img.convert('RGB')
+
+        # A pixel is white when the darkest of its channels is still 255
+        red, green, blue = img.split()
+        darkest = ImageChops.darker(ImageChops.darker(red, green), blue)
+        img.putalpha(darkest.point(WHITE_TO_TRANSPARENT_LUT))
+
+    # Label bitmaps are small and mostly flat, so the fastest zlib level costs little in size
+    output = io.BytesIO()
+    img.save(output, 'PNG', optimize=False, compress_level=1, **save_options)
+    return output.getvalue()
+
+
+def _memory_temp_dir(required_bytes):
+    """Return /dev/shm when it is writable with room for required_bytes, else None (the default temp dir)."""
+    shm_dir = '/dev/shm'
+    if os.path.isdir(shm_dir) and os.access(shm_dir, os.W_OK):
+        try:
+            if shutil.disk_usage(shm_dir).free > required_bytes:
+                return shm_dir
+        except OSError:
+            pass
+    return None
+
+
+def _convert_bmp_members(zip_ref, member_names, verbose=False):
+    """
+    Convert BMP archive members to transparent PNG data, keyed by member name.
+
+    Pillow converts the members straight from the archive, on a thread pool when
+    there are several (it releases the GIL while decoding and encoding). Members it cannot
+    handle (or all of them, when Pillow is missing) go through a single
+    ImageMagick batch in a temporary directory. Members that cannot be converted
+    are left out.
+    """
+    converted = {}
+    remaining = []
+
+    if PILLOW_AVAILABLE and member_names:
+        # Identical bitmaps (the same icon placed several times) are converted once.
+        # The CRC-32 and size in the archive directory identify them without reading them.
+        members_by_key = {}
+        for member_name in member_names:
+            info = zip_ref.getinfo(member_name)
+            members_by_key.setdefault((info.CRC, info.file_size), []).append(member_name)
+        member_groups = list(members_by_key.values())
+
+        def convert(member_name):
+            # Each member is read only when its conversion runs
+            with zip_ref.open(member_name) as bmp_file:
+                return _bmp_to_transparent_png(bmp_file)
+
+        if len(member_groups) > 1:
+            with ThreadPoolExecutor() as executor:
+                futures = [executor.submit(convert, group[0]) for group in member_groups]
+        else:
+            futures = None
+
+        for index, group in enumerate(member_groups):
+            try:
+                png_data = futures[index].result() if futures else convert(group[0])
+            except Exception as e:
+                if verbose:
+                    print(f"Error converting {group[0]} with Pillow: {e}")
+                remaining.extend(group)
+                continue
+            for member_name in group:
+                converted[member_name] = png_data
+    else:
+        remaining = list(member_names)
+
+    if remaining and imagemagick_command():
+        # Keep the round trip through ImageMagick in RAM where possible; the PNGs
+        # written next to the BMPs are no bigger than the bitmaps themselves
+        bmp_size = sum(zip_ref.getinfo(member_name).file_size for member_name in remaining)
+        with tempfile.TemporaryDirectory(prefix='lbx_', dir=_memory_temp_dir(2 * bmp_size)) as temp_dir:
+            # Numbered temp names keep mogrify's output names predictable
+            conversions = []
+            for index, member_name in enumerate(remaining):
+                bmp_path = os.path.join(temp_dir, f"{index}.bmp")
+                with zip_ref.open(member_name) as source, open(bmp_path, 'wb') as f:
+                    shutil.copyfileobj(source, f)
+                conversions.append((bmp_path, os.path.join(temp_dir, f"{index}.png")))
+
+            png_paths = dict(conversions)
+            for bmp_path in convert_bmps_with_imagemagick(conversions, verbose):
+                index = int(os.path.splitext(os.path.basename(bmp_path))[0])
+                with open(png_paths[bmp_path], 'rb') as f:
+                    converted[remaining[index]] = f.read()
+
+    return converted
+
+
+def _backup_lbx(lbx_file_path):
+    """
+    Keep the current LBX as a .bak file without copying its contents.
+
+    The backup is a hard link where the file system allows, so the LBX stays in
+    place until the caller replaces it. Otherwise the LBX is renamed to the
+    backup, which the caller must follow by moving the new archive into place.
+    """
+    backup_path = lbx_file_path + '.bak'
+    if os.path.lexists(backup_path):
+        os.remove(backup_path)
+    try:
+        os.link(lbx_file_path, backup_path)
+    except OSError:
+        os.replace(lbx_file_path, backup_path)
+    return backup_path
+
+
+def modify_label_xml(lbx_file_path, bmp_to_png_conversions, verbose=False, document=None):
+    """
+    Convert BMP images in an LBX file to transparent PNGs and update label.xml to match.
+
+    bmp_to_png_conversions holds image info dicts as returned by extract_images_from_lbx;
+    entries that are not BMP members are ignored. Each BMP becomes a PNG named after
+    its original name, or after its own member name when another image already took
+    that name (P-touch often places the same part image twice). Everything happens
+    in memory: the converted images and the edited label.xml are substituted while
+    the other members are copied across into a new archive, which then replaces the
+    original. The original is kept as .bak.
+    """
     if not bmp_to_png_conversions:
         return False
 
     try:
-        # Create a temporary directory for our work
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Extract the archive
-            with zipfile.ZipFile(lbx_file_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-
-            # Path to label.xml
-            label_xml_path = os.path.join(temp_dir, 'label.xml')
+        with _open_document(lbx_file_path, document) as document:
+            zip_ref = document.zip
 
-            if not os.path.exists(label_xml_path):
+            if 'label.xml' not in document.names:
                 if verbose:
                     print("label.xml not found in the archive")
                 return False
 
-            # Read the XML content
-            with open(label_xml_path, 'r', encoding='utf-8') as f:
-                xml_content = f.read()
+            # Only BMP members that are actually in the archive are converted
+            bmp_infos = [
+                bmp_info for bmp_info in bmp_to_png_conversions
+                if bmp_info['base_name'].lower().endswith('.bmp') and bmp_info['filename'] in document.names
+            ]
+            png_data_by_member = _convert_bmp_members(zip_ref, [bmp_info['filename'] for bmp_info in bmp_infos], verbose)
+
+            # Nothing converted means nothing to rewrite, so leave the archive (and any backup) alone
+            if not png_data_by_member:
+                if verbose:
+                    print("No BMP images were converted")
+                return False
+
+            # Read the XML content; it is edited as UTF-8 bytes, never decoded
+            xml_content = zip_ref.read('label.xml')
 
             # Track if we made any changes
             changes_made = False
 
-            # Track which files need to be renamed or converted in the archive
-            files_to_convert = []
+            # Converted members, keyed by BMP member name, with their new name and PNG data
+            converted_members = {}
 
-            # For each BMP to PNG conversion, update references in the XML
-            for bmp_info in bmp_to_png_conversions:
-                original_name = bmp_info['original_name']
-                base_name = bmp_info['base_name']
-                original_ext = os.path.splitext(original_name)[1]
+            # Archive names that are already taken by members that are kept as they are
+            taken_names = {name for name in document.names if name not in png_data_by_member}
 
-                # Only continue if the original file was a BMP
-                if original_ext.lower() != '.bmp':
+            # For each converted BMP, update references in the XML
+            for bmp_info in bmp_infos:
+                if bmp_info['filename'] not in png_data_by_member or bmp_info['filename'] in converted_members:
                     continue
 
+                original_name = bmp_info['original_name']
+                base_name = bmp_info['base_name']
+
                 # The original name in the XML may already be .png even if the file was .bmp
                 original_basename = os.path.splitext(original_name)[0]
 
-                # Add file to our conversion list
-                files_to_convert.append({
-                    'original_file': base_name,
-                    'new_file': f"{original_basename}.png"
-                })
-
-                # Patterns to look for (both .bmp and potentially already .png in the XML)
-                patterns = [
-                    f'originalName="{original_basename}\\.bmp"',
-                    f'originalName="{original_basename}\\.BMP"',
-                    f'fileName="{base_name}"',  # Exact match for filename attribute
-                ]
-
-                # Replacement patterns
+                # Each PNG needs its own member name, or one image would be lost
+                member_stem = os.path.splitext(bmp_info['filename'])[0]
+                candidate_names = chain(
+                    [f"{original_basename}.png", f"{member_stem}.png"],
+                    (f"{member_stem}_{n}.png" for n in count(2))
+                )
+                new_file = next(name for name in candidate_names if name not in taken_names)
+                taken_names.add(new_file)
+                converted_members[bmp_info['filename']] = (new_file, png_data_by_member[bmp_info['filename']])
+
+                # Exact attribute values to look for (both .bmp and potentially already .png
+                # in the XML), with their replacements
                 replacements = [
-                    f'originalName="{original_basename}.png"',
-                    f'originalName="{original_basename}.png"',
-                    f'fileName="{original_basename}.png"',
+                    (f'originalName="{original_basename}.bmp"', f'originalName="{original_basename}.png"'),
+                    (f'originalName="{original_basename}.BMP"', f'originalName="{original_basename}.png"'),
+                    (f'fileName="{base_name}"', f'fileName="{new_file}"'),
                 ]
 
-                # Perform replacements
-                for pattern, replacement in zip(patterns, replacements):
-                    new_content = re.sub(pattern, replacement, xml_content)
-                    if new_content != xml_content:
+                # Perform replacements; these are literal matches, so no regex is needed
+                for old_value, new_value in replacements:
+                    old_value = old_value.encode('utf-8')
+                    if old_value in xml_content:
+                        xml_content = xml_content.replace(old_value, new_value.encode('utf-8'))
                         changes_made = True
-                        xml_content = new_content
                         if verbose:
                             print(f"Updated XML reference for {original_name} to PNG")
 
@@ -325,58 +742,39 @@ def modify_label_xml(lbx_file_path, bmp_to_png_conversions, verbose=False):
                     print("No XML references needed updating")
                 return False
 
-            # Write back the modified XML
-            with open(label_xml_path, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
-
-            # Now convert BMP files to PNG and add them to the archive
-            for file_info in files_to_convert:
-                orig_file = os.path.join(temp_dir, file_info['original_file'])
-                new_file = os.path.join(temp_dir, file_info['new_file'])
-
-                if os.path.exists(orig_file) and IMAGEMAGICK_AVAILABLE:
-                    try:
-                        # Use ImageMagick to convert BMP to PNG with white as transparent
-                        cmd = [
-                            IMAGEMAGICK_COMMAND,
-                            orig_file,
-                            "-transparent", "white",
-                            new_file
-                        ]
-
-                        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-                        if result.returncode == 0:
-                            # Remove the original BMP file from temp dir
-                            os.remove(orig_file)
+            # Copy the members into a new archive, substituting the changed ones
+            temp_path = lbx_file_path + '.tmp'
+            try:
+                with zipfile.ZipFile(temp_path, 'w') as new_zip:
+                    for info in zip_ref.infolist():
+                        if info.filename == 'label.xml':
+                            data = xml_content
+                        elif info.filename in converted_members:
+                            new_file, data = converted_members[info.filename]
                             if verbose:
-                                print(f"Converted {file_info['original_file']} to {file_info['new_file']} in archive")
+                                print(f"Converted {info.filename} to {new_file} in archive")
+                            info = zipfile.ZipInfo(new_file, info.date_time)
                         else:
-                            if verbose:
-                                print(f"ImageMagick conversion failed in archive: {result.stderr.decode()}")
-                    except Exception as e:
-                        if verbose:
-                            print(f"Error converting image in archive: {e}")
+                            data = zip_ref.read(info)
 
-            # Create a new zip file with updated content
-            backup_path = lbx_file_path + '.bak'
-            shutil.copy2(lbx_file_path, backup_path)
+                        # Deflate XML and bitmaps, store already-compressed images as they are
+                        info.compress_type, compresslevel = zip_compression(info.filename)
+                        new_zip.writestr(info, data, compresslevel=compresslevel)
 
-            # Create the new zip file
-            with zipfile.ZipFile(lbx_file_path, 'w') as new_zip:
-                # Add all files from the temp directory
-                for root, _, files in os.walk(temp_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, temp_dir)
-                        new_zip.write(file_path, arcname)
+                # Keep the original as a backup, then swap the new archive into place
+                document.release_file()
+                backup_path = _backup_lbx(lbx_file_path)
+                os.replace(temp_path, lbx_file_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
 
-            if verbose:
-                print(f"Updated LBX file with modified XML references and converted images. Backup saved to {backup_path}")
-            else:
-                print(f"Updated LBX file with PNG images. Backup saved to {backup_path}")
+        if verbose:
+            print(f"Updated LBX file with modified XML references and converted images. Backup saved to {backup_path}")
+        else:
+            print(f"Updated LBX file with PNG images. Backup saved to {backup_path}")
 
-            return True
+        return True
 
     except Exception as e:
         print(f"Error modifying label.xml: {e}")
@@ -396,19 +794,22 @@ def save_text_to_file(lbx_file_path, text_blocks, output_ext='.txt'):
     folder_name = os.path.basename(os.path.dirname(lbx_file_path))
     file_name = os.path.basename(lbx_file_path)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        # Write a simple markdown H1 header with folder/filename
-        f.write(f"# {folder_name}/{file_name}\n\n")
+    # A simple markdown H1 header with folder/filename, then the text blocks without any prefixes
+    content = f"# {folder_name}/{file_name}\n\n" + ''.join(f"{text}\n\n" for text in text_blocks)
 
-        # Write text blocks without any prefixes
-        for text in text_blocks:
-            f.write(f"{text}\n\n")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(content)
 
     print(f"Text extracted and saved to {output_path}")
 
 
-def save_images_to_folder(lbx_file_path, images_info, use_db=False, verbose=False):
-    """Save extracted images to a folder named after the LBX file."""
+def save_images_to_folder(lbx_file_path, images_info, use_db=False, verbose=False, document=None, recompress=False):
+    """
+    Save extracted images to a folder named after the LBX file.
+
+    PNG images are copied out unchanged unless recompress is True, in which case
+    they go through the same grayscale re-encode as other formats.
+    """
     if not images_info:
         print(f"No images found in {lbx_file_path}")
         return
@@ -429,8 +830,27 @@ def save_images_to_folder(lbx_file_path, images_info, use_db=False, verbose=Fals
     bmp_to_png_conversions = []
     has_bmp_files = False
 
+    # If using database, update the label file of every part and look up all names at once
+    part_names = {}
+    if use_db:
+        # Assume part_num is the same as original name without extension
+        part_nums = [os.path.splitext(img_info['original_name'])[0] for img_info in images_info]
+        parent_folder = os.path.basename(os.path.dirname(lbx_file_path))
+        label_file = f"{parent_folder}/{os.path.basename(lbx_file_path)}"
+
+        db_updated_count = update_part_label_files(part_nums, label_file)
+        part_names = get_part_names(part_nums)
+
+        if verbose:
+            for part_num in dict.fromkeys(part_nums):
+                if part_num in part_names:
+                    print(f"Updated database for part {part_num}")
+                if part_names.get(part_num):
+                    print(f"Found part name for {part_num}: {part_names[part_num]}")
+
     try:
-        with zipfile.ZipFile(lbx_file_path, 'r') as zip_ref:
+        with _open_document(lbx_file_path, document) as document:
+            zip_ref = document.zip
             for img_info in images_info:
                 img_file = img_info['filename']
                 base_name = img_info['base_name']
@@ -446,28 +866,8 @@ def save_images_to_folder(lbx_file_path, images_info, use_db=False, verbose=Fals
                 original_name_no_ext = os.path.splitext(original_name)[0]
                 part_num = original_name_no_ext  # Assume part_num is the same as original name without extension
 
-                # Read image data
-                img_data = zip_ref.read(img_file)
-
-                # If using database, check for part information and update database
-                part_name = None
-                if use_db:
-                    # Try to update the database with the LBX file information
-                    relative_path = os.path.relpath(lbx_file_path, os.getcwd())
-                    parent_folder = os.path.basename(os.path.dirname(lbx_file_path))
-                    label_file = f"{parent_folder}/{os.path.basename(lbx_file_path)}"
-
-                    if update_part_label_file(part_num, label_file):
-                        db_updated_count += 1
-                        if verbose:
-                            print(f"Updated database for part {part_num}")
-
-                    # Get part name from database
-                    part_name = get_part_info(part_num)
-                    if part_name and verbose:
-                        print(f"Found part name for {part_num}: {part_name}")
-
                 # Create enhanced filename if part name is available
+                part_name = part_names.get(part_num)
                 if part_name:
                     sanitized_name = sanitize_filename(part_name)
                     enhanced_name = f"{part_num}-{sanitized_name}"
@@ -478,29 +878,42 @@ def save_images_to_folder(lbx_file_path, images_info, use_db=False, verbose=Fals
                 original_ext = os.path.splitext(base_name)[1]
                 original_output_path = os.path.join(output_folder, f"{enhanced_name}{original_ext}")
 
-                # Check if we're dealing with a BMP file and can use ImageMagick
-                if original_ext.lower() == '.bmp' and IMAGEMAGICK_AVAILABLE:
+                # Convert BMP files to PNG with white made transparent, in-process when possible
+                if original_ext.lower() == '.bmp' and PILLOW_AVAILABLE:
                     try:
-                        # Save the original BMP temporarily to convert it
-                        temp_bmp_path = os.path.join(output_folder, f"temp_{enhanced_name}.bmp")
-                        with open(temp_bmp_path, 'wb') as f:
-                            f.write(img_data)
+                        output_path = os.path.join(output_folder, f"{enhanced_name}.png")
+                        with open(output_path, 'wb') as f:
+                            with zip_ref.open(img_file) as bmp_file:
+                                f.write(_bmp_to_transparent_png(bmp_file))
 
+                        converted_count += 1
+                        extracted_count += 1
+                        if verbose:
+                            print(f"Converted BMP to transparent PNG: {enhanced_name}")
+                        continue  # Skip the rest of the processing
+                    except Exception as e:
+                        if verbose:
+                            print(f"Error converting {enhanced_name} to transparent PNG: {e}")
+                        # Fall back to ImageMagick and the other methods
+
+                # Otherwise use ImageMagick for BMP files if it is available
+                if original_ext.lower() == '.bmp' and imagemagick_command():
+                    try:
                         # Define output path for PNG
                         output_path = os.path.join(output_folder, f"{enhanced_name}.png")
 
-                        # Use ImageMagick to convert BMP to PNG with white as transparent
+                        # Use ImageMagick to convert BMP to PNG with white as transparent,
+                        # piping the BMP in on stdin rather than through a temporary file
                         cmd = [
-                            IMAGEMAGICK_COMMAND,
-                            temp_bmp_path,
+                            imagemagick_command(),
+                            "bmp:-",
                             "-transparent", "white",
                             output_path
                         ]
 
-                        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-                        # Remove temporary BMP file
-                        os.remove(temp_bmp_path)
+                        result = subprocess.run(
+                            cmd, input=zip_ref.read(img_file), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                        )
 
                         if result.returncode == 0:
                             converted_count += 1
@@ -517,11 +930,20 @@ def save_images_to_folder(lbx_file_path, images_info, use_db=False, verbose=Fals
                             print(f"Error using ImageMagick to convert {enhanced_name}: {e}")
                         # Fall back to other methods
 
+                # PNGs are already compressed, so copy them out as they are unless asked not to
+                if original_ext.lower() == '.png' and not recompress:
+                    with zip_ref.open(img_file) as source, open(original_output_path, 'wb') as f:
+                        shutil.copyfileobj(source, f)
+                    extracted_count += 1
+                    continue
+
                 # Try to compress and optimize image if Pillow is available
                 if PILLOW_AVAILABLE:
                     try:
-                        # Load image from binary data
-                        img = Image.open(io.BytesIO(img_data))
+                        # Decode the image straight from the archive member
+                        with zip_ref.open(img_file) as source:
+                            img = Image.open(source)
+                            img.load()
 
                         # Check if image is already grayscale, if not convert it
                         if img.mode not in ['L', 'LA', '1']:
@@ -532,10 +954,11 @@ def save_images_to_folder(lbx_file_path, images_info, use_db=False, verbose=Fals
                         # Create optimized PNG output path
                         output_path = os.path.join(output_folder, f"{enhanced_name}.png")
 
-                        # Save as optimized PNG
-                        img.save(output_path, 'PNG', optimize=True, compress_level=9)
+                        # Save as compressed PNG; zlib's default level is within a few percent
+                        # of level 9 (which optimize=True forces) at a fraction of the CPU
+                        img.save(output_path, 'PNG', compress_level=6)
 
-                        if os.path.getsize(output_path) < len(img_data) or original_ext.lower() != '.png':
+                        if os.path.getsize(output_path) < zip_ref.getinfo(img_file).file_size or original_ext.lower() != '.png':
                             compressed_count += 1
                             if verbose:
                                 print(f"Compressed {enhanced_name} successfully")
@@ -550,14 +973,14 @@ def save_images_to_folder(lbx_file_path, images_info, use_db=False, verbose=Fals
 
                 # If we reach here, either Pillow is not available or compression failed
                 # Save the original uncompressed image
-                with open(original_output_path, 'wb') as f:
-                    f.write(img_data)
+                with zip_ref.open(img_file) as source, open(original_output_path, 'wb') as f:
+                    shutil.copyfileobj(source, f)
 
                 extracted_count += 1
 
         # If we found any BMP files, update the archive with PNG replacements
-        if has_bmp_files and IMAGEMAGICK_AVAILABLE:
-            if modify_label_xml(lbx_file_path, bmp_to_png_conversions, verbose):
+        if has_bmp_files and (PILLOW_AVAILABLE or imagemagick_command()):
+            if modify_label_xml(lbx_file_path, bmp_to_png_conversions, verbose, document=document):
                 if verbose:
                     print(f"Updated XML references and converted images in {lbx_file_path}")
 
@@ -580,6 +1003,78 @@ def save_images_to_folder(lbx_file_path, images_info, use_db=False, verbose=Fals
         print(f"Error saving images from {lbx_file_path}: {e}")
 
 
+@dataclass
+class ProcessOptions:
+    """Command-line settings for process_lbx_file, kept picklable for worker processes."""
+    output_ext: str = '.txt'
+    verbose: bool = False
+    extract_images: bool = False
+    use_db: bool = False
+    recompress: bool = False
+
+
+def extract_all_from_lbx(lbx_file_path, verbose=False, document=None):
+    """
+    Extract text blocks and image info from an LBX file in one pass.
+
+    Returns (text_blocks, images_info) as extract_text_from_lbx and
+    extract_images_from_lbx(extract_images=True) would, with the archive
+    opened and label.xml scanned only once.
+    """
+    with _open_document(lbx_file_path, document) as document:
+        text_blocks = extract_text_from_lbx(lbx_file_path, verbose=verbose, document=document)
+        images_info = extract_images_from_lbx(lbx_file_path, extract_images=True, verbose=verbose, document=document)
+    return text_blocks, images_info
+
+
+def process_lbx_file(lbx_file, options):
+    """
+    Process a single LBX file with BMP to PNG conversion.
+
+    The archive is opened and label.xml scanned once; only when BMP images were
+    converted (which replaces the archive) is the new archive opened for extraction.
+    """
+    print(f"\nProcessing {lbx_file}...")
+
+    try:
+        with contextlib.ExitStack() as stack:
+            document = stack.enter_context(LbxDocument(lbx_file))
+
+            # First convert any BMP images in the archive to transparent PNGs
+            bmp_images = [
+                img_info for img_info in extract_images_from_lbx(lbx_file, extract_images=True, document=document)
+                if img_info['base_name'].lower().endswith('.bmp')
+            ]
+            if bmp_images and (PILLOW_AVAILABLE or imagemagick_command()):
+                print(f"Found BMP files in {lbx_file}, converting to PNG...")
+                if modify_label_xml(lbx_file, bmp_images, options.verbose, document=document):
+                    document = stack.enter_context(LbxDocument(lbx_file))
+
+            # Now proceed with normal processing, sharing one open archive
+            text_blocks, images_info = extract_all_from_lbx(
+                lbx_file,
+                verbose=options.verbose,
+                document=document
+            )
+            save_text_to_file(
+                lbx_file,
+                text_blocks,
+                output_ext=options.output_ext
+            )
+
+            if options.extract_images:
+                save_images_to_folder(
+                    lbx_file,
+                    images_info,
+                    use_db=options.use_db,
+                    verbose=options.verbose,
+                    document=document,
+                    recompress=options.recompress
+                )
+    except Exception as e:
+        print(f"Error processing {lbx_file}: {e}")
+
+
 def parse_arguments():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description='Extract text from Brother P-Touch Editor LBX files.')
@@ -597,6 +1092,8 @@ def parse_arguments():
                        help='Extract images from LBX files and save them to a folder')
     parser.add_argument('--db', dest='use_db', action='store_true', default=False,
                        help='Use SQLite database for part information and update database')
+    parser.add_argument('--recompress', dest='recompress', action='store_true', default=False,
+                       help='Re-encode PNG images when extracting instead of copying them as-is')
 
     return parser.parse_args()
 
@@ -618,7 +1115,7 @@ def main():
     print(f"Searching for LBX files in {args.directory}" +
           (" and subdirectories..." if args.recursive else "..."))
 
-    lbx_files = find_lbx_files(args.directory, args.recursive)
+    lbx_files = list(find_lbx_files(args.directory, args.recursive))
 
     if not lbx_files:
         print("No LBX files found.")
@@ -626,147 +1123,28 @@ def main():
 
     print(f"Found {len(lbx_files)} LBX file(s).")
 
-    # Process BMP to PNG conversions for LBX files
-    def process_lbx_with_png_conversion(lbx_file):
-        """Process a single LBX file with BMP to PNG conversion."""
-        print(f"\nProcessing {lbx_file}...")
-
-        # First check if the file contains BMP images that need conversion
-        bmp_found = False
-
-        # Extract to a temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Extract the archive
-            with zipfile.ZipFile(lbx_file, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-                # Check for BMP files
-                bmp_files = [f for f in zip_ref.namelist() if f.lower().endswith('.bmp')]
-                if bmp_files:
-                    bmp_found = True
-
-            # If we found BMP files and ImageMagick is available, convert them
-            if bmp_found and IMAGEMAGICK_AVAILABLE:
-                print(f"Found BMP files in {lbx_file}, converting to PNG...")
-
-                # Path to label.xml
-                label_xml_path = os.path.join(temp_dir, 'label.xml')
-
-                if os.path.exists(label_xml_path):
-                    # Read the XML to find image mappings
-                    with open(label_xml_path, 'r', encoding='utf-8') as f:
-                        xml_content = f.read()
-
-                    # Look for image tags with originalName and fileName attributes
-                    image_tags = re.findall(r'<image:imageStyle\s+originalName="([^"]*?)"\s+[^>]*?fileName="([^"]*?)"[^>]*?>', xml_content)
-                    file_name_to_original = {}
-
-                    # Create mapping from fileName to originalName
-                    for original_name, file_name in image_tags:
-                        file_name_to_original[file_name] = original_name
-
-                    # Process each BMP file
-                    changes_made = False
-                    for bmp_file in bmp_files:
-                        bmp_path = os.path.join(temp_dir, bmp_file)
-                        file_base = os.path.basename(bmp_file)
-
-                        # Get the original name (usually has .png extension in XML)
-                        original_name = file_name_to_original.get(file_base, file_base)
-                        original_basename = os.path.splitext(original_name)[0]
-
-                        # Output PNG path
-                        png_file = f"{original_basename}.png"
-                        png_path = os.path.join(temp_dir, png_file)
-
-                        # Convert BMP to PNG with transparent white
-                        if args.verbose:
-                            print(f"Converting {bmp_file} to {png_file}...")
-
-                        try:
-                            # Use ImageMagick to convert BMP to PNG with white as transparent
-                            cmd = [
-                                IMAGEMAGICK_COMMAND,
-                                bmp_path,
-                                "-transparent", "white",
-                                png_path
-                            ]
-
-                            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-                            if result.returncode == 0:
-                                # Remove the original BMP file
-                                os.remove(bmp_path)
-
-                                # Update XML references
-                                patterns = [
-                                    f'fileName="{file_base}"',
-                                ]
-                                replacements = [
-                                    f'fileName="{png_file}"',
-                                ]
-
-                                for pattern, replacement in zip(patterns, replacements):
-                                    new_content = re.sub(pattern, replacement, xml_content)
-                                    if new_content != xml_content:
-                                        changes_made = True
-                                        xml_content = new_content
-
-                                if args.verbose:
-                                    print(f"Successfully converted {bmp_file} to transparent PNG")
-                            else:
-                                if args.verbose:
-                                    print(f"ImageMagick conversion failed: {result.stderr.decode()}")
-                        except Exception as e:
-                            if args.verbose:
-                                print(f"Error converting {bmp_file}: {e}")
-
-                    # If changes made to XML, write it back
-                    if changes_made:
-                        with open(label_xml_path, 'w', encoding='utf-8') as f:
-                            f.write(xml_content)
-
-                # Create a backup of the original file
-                backup_path = lbx_file + '.bak'
-                shutil.copy2(lbx_file, backup_path)
-
-                # Create a new archive with the modified files
-                with zipfile.ZipFile(lbx_file, 'w') as new_zip:
-                    # Add all files from the temp directory
-                    for root, _, files in os.walk(temp_dir):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            arcname = os.path.relpath(file_path, temp_dir)
-                            new_zip.write(file_path, arcname)
-
-                print(f"Updated {lbx_file} with PNG images. Backup saved to {backup_path}")
-
-        # Now proceed with normal processing
-        text_blocks = extract_text_from_lbx(
-            lbx_file,
-            verbose=args.verbose
-        )
-        save_text_to_file(
-            lbx_file,
-            text_blocks,
-            output_ext=args.output_ext
-        )
-
-        if args.extract_images:
-            images_info = extract_images_from_lbx(
-                lbx_file,
-                extract_images=True,
-                verbose=args.verbose
-            )
-            save_images_to_folder(
-                lbx_file,
-                images_info,
-                use_db=args.use_db,
-                verbose=args.verbose
-            )
-
-    # Process each LBX file
-    for lbx_file in lbx_files:
-        process_lbx_with_png_conversion(lbx_file)
+    if use_fast_deflate() and args.verbose:
+        print("Using zlib-ng for ZIP compression")
+
+    options = ProcessOptions(
+        output_ext=args.output_ext,
+        verbose=args.verbose,
+        extract_images=args.extract_images,
+        use_db=args.use_db,
+        recompress=args.recompress
+    )
+
+    # Files are independent, so process them in parallel unless verbose output needs to stay ordered
+    if len(lbx_files) > 1 and not args.verbose:
+        # No more workers than files, and hand them files in batches so a large
+        # directory of small labels is not dominated by per-task overhead
+        max_workers = min(os.cpu_count() or 1, len(lbx_files))
+        chunksize = max(1, len(lbx_files) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=use_fast_deflate) as executor:
+            list(executor.map(process_lbx_file, lbx_files, repeat(options), chunksize=chunksize))
+    else:
+        for lbx_file in lbx_files:
+            process_lbx_file(lbx_file, options)
 
     print("\nDone!")
     return 0
@@ -21,6 +21,7 @@ Usage examples:
   This adds " Brick" to the end of each text object
 - Regex to format part numbers: lbx_text_edit.py replace input.lbx -f "(\d{4})(\d)?" -r "Part #\1-\2" --regex
   This formats numbers like "30182" to "Part #3018-2"
+- Several replacements in one pass: lbx_text_edit.py replace-many input.lbx -p "2x2" "2×2" -p "1x2" "1×2"
 
 The program can be used as a library in other scripts or as a command-line tool.
 
@@ -32,14 +33,25 @@ CRITICAL NOTES ABOUT THE BROTHER P-TOUCH LBX FORMAT:
 5. The order of XML elements matters and must be preserved exactly
 """
 
+import io
 import os
 import re
 import shutil
 import zipfile
 import tempfile
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Tuple, Optional, Union, Any
-from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, Pattern, Match, Union, Any, BinaryIO, Callable, Iterator
+from dataclasses import dataclass, field, replace as dc_replace
+
+from .utils.archive import zip_compression
+
+# lxml parses, searches and serializes label.xml in C; ElementTree is the fallback
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
 
 
 # Define the XML namespaces used in label.xml files
@@ -61,6 +73,59 @@ for prefix, uri in NAMESPACES.items():
     ET.register_namespace(prefix, uri)
 
 
+def _compile_path(path: str):
+    """Compile a namespaced path once, returning a callable that yields the matching elements."""
+    if LXML_AVAILABLE:
+        return ET.XPath(path, namespaces=NAMESPACES)
+    return lambda element: element.findall(path, NAMESPACES)
+
+
+def _first(path, element: ET.Element) -> Optional[ET.Element]:
+    """Return the first element matched by a compiled path, or None."""
+    matches = path(element)
+    return matches[0] if matches else None
+
+
+def _parent_of(root: ET.Element, target: ET.Element) -> Optional[ET.Element]:
+    """Return the parent of target within root, or None if target is root or outside it."""
+    if LXML_AVAILABLE:
+        return target.getparent() if target is not root else None
+    # In LBX files pt:data and the string items sit directly under text:text
+    if any(child is target for child in root):
+        return root
+    # ElementTree keeps no parent links, so map each child to its parent in one pass
+    parent_map = {id(child): parent for parent in root.iter() for child in parent}
+    return parent_map.get(id(target))
+
+
+# Namespace-qualified tags, built once
+_TAG_TEXT = f"{{{NAMESPACES['text']}}}text"
+_TAG_STRING_ITEM = f"{{{NAMESPACES['text']}}}stringItem"
+_TAG_PT_FONT_INFO = f"{{{NAMESPACES['text']}}}ptFontInfo"
+_TAG_LOG_FONT = f"{{{NAMESPACES['text']}}}logFont"
+_TAG_FONT_EXT = f"{{{NAMESPACES['text']}}}fontExt"
+
+# Group references inside a pattern, which a combined alternation would renumber
+_BACKREFERENCE_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str, flags: int = 0) -> Pattern:
+    """Compile a regular expression once and reuse it across calls and editors."""
+    return re.compile(pattern, flags)
+
+
+# Buffer size for copying archive members between files
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+# Paths used while reading and updating text objects, compiled once
+_XP_TEXT = _compile_path('.//text:text')
+_XP_DATA = _compile_path('.//pt:data')
+_XP_STRING_ITEMS = _compile_path('.//text:stringItem')
+_XP_LOGFONT = _compile_path('./text:ptFontInfo/text:logFont')
+_XP_FONTEXT = _compile_path('./text:ptFontInfo/text:fontExt')
+
+
 @dataclass
 class FontInfo:
     """Represents font information for a string item."""
@@ -79,6 +144,31 @@ class FontInfo:
     text_print_color_number: str = "1"
 
 
+def _parse_bool(value: str) -> bool:
+    """Parse an XML boolean attribute value."""
+    return value.lower() == 'true'
+
+
+# (XML attribute, FontInfo field, converter) for the logFont and fontExt elements
+_LOG_FONT_ATTRIBUTES = (
+    ('name', 'name', str),
+    ('width', 'width', int),
+    ('italic', 'italic', _parse_bool),
+    ('weight', 'weight', int),
+    ('charSet', 'char_set', int),
+    ('pitchAndFamily', 'pitch_and_family', str),
+)
+_FONT_EXT_ATTRIBUTES = (
+    ('effect', 'effect', str),
+    ('underline', 'underline', int),
+    ('strikeout', 'strikeout', int),
+    ('size', 'size', str),
+    ('orgSize', 'org_size', str),
+    ('textColor', 'text_color', str),
+    ('textPrintColorNumber', 'text_print_color_number', str),
+)
+
+
 @dataclass
 class StringItem:
     """
@@ -89,7 +179,13 @@ class StringItem:
     """
     char_len: int
     font_info: FontInfo
-    start_pos: int = 0  # Position in the original string
+    # Position in the original string, as read. It is not kept up to date by edits,
+    # which work offsets out from the char_len values instead.
+    start_pos: int = 0
+    # The element this item was read from and the font info as read, so an
+    # unchanged item can be written back as it was
+    _source: Optional[ET.Element] = field(default=None, repr=False, compare=False)
+    _source_font_info: Optional[FontInfo] = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_element(cls, element: ET.Element, start_pos: int = 0) -> 'StringItem':
@@ -105,42 +201,40 @@ class StringItem:
         """
         char_len = int(element.get('charLen', '0'))
 
-        # Parse font info
-        font_info = FontInfo()
-        font_elem = element.find('.//text:logFont', NAMESPACES)
-        if font_elem is not None:
-            font_info.name = font_elem.get('name', font_info.name)
-            font_info.width = int(font_elem.get('width', '0'))
-            font_info.italic = font_elem.get('italic', 'false').lower() == 'true'
-            font_info.weight = int(font_elem.get('weight', '400'))
-            font_info.char_set = int(font_elem.get('charSet', '0'))
-            font_info.pitch_and_family = font_elem.get('pitchAndFamily', font_info.pitch_and_family)
-
-        font_ext_elem = element.find('.//text:fontExt', NAMESPACES)
-        if font_ext_elem is not None:
-            font_info.effect = font_ext_elem.get('effect', font_info.effect)
-            font_info.underline = int(font_ext_elem.get('underline', '0'))
-            font_info.strikeout = int(font_ext_elem.get('strikeout', '0'))
-            font_info.size = font_ext_elem.get('size', font_info.size)
-            font_info.org_size = font_ext_elem.get('orgSize', font_info.org_size)
-            font_info.text_color = font_ext_elem.get('textColor', font_info.text_color)
-            font_info.text_print_color_number = font_ext_elem.get('textPrintColorNumber', font_info.text_print_color_number)
-
-        return cls(char_len=char_len, font_info=font_info, start_pos=start_pos)
+        # Parse font info, converting only the attributes that are present
+        font_values = {}
+        for path, schema in ((_XP_LOGFONT, _LOG_FONT_ATTRIBUTES), (_XP_FONTEXT, _FONT_EXT_ATTRIBUTES)):
+            font_elem = _first(path, element)
+            if font_elem is not None:
+                attrib = font_elem.attrib
+                for attribute, field_name, convert in schema:
+                    if attribute in attrib:
+                        font_values[field_name] = convert(attrib[attribute])
+        font_info = FontInfo(**font_values)
+
+        return cls(char_len=char_len, font_info=font_info, start_pos=start_pos,
+                   _source=element, _source_font_info=dc_replace(font_info))
 
     def to_element(self) -> ET.Element:
         """
         Convert the StringItem to an XML element.
 
+        An item read from label.xml whose font info has not changed reuses its
+        original element with only charLen updated.
+
         Returns:
             An XML Element representing this string item with proper font info
         """
-        string_item = ET.Element(f"{{{NAMESPACES['text']}}}stringItem", {'charLen': str(self.char_len)})
+        if self._source is not None and self.font_info == self._source_font_info:
+            self._source.set('charLen', str(self.char_len))
+            return self._source
+
+        string_item = ET.Element(_TAG_STRING_ITEM, {'charLen': str(self.char_len)})
 
         # Create font info elements
-        pt_font_info = ET.SubElement(string_item, f"{{{NAMESPACES['text']}}}ptFontInfo")
+        pt_font_info = ET.SubElement(string_item, _TAG_PT_FONT_INFO)
 
-        log_font = ET.SubElement(pt_font_info, f"{{{NAMESPACES['text']}}}logFont", {
+        log_font = ET.SubElement(pt_font_info, _TAG_LOG_FONT, {
             'name': self.font_info.name,
             'width': str(self.font_info.width),
             'italic': 'true' if self.font_info.italic else 'false',
@@ -149,7 +243,7 @@ class StringItem:
             'pitchAndFamily': str(self.font_info.pitch_and_family)
         })
 
-        font_ext = ET.SubElement(pt_font_info, f"{{{NAMESPACES['text']}}}fontExt", {
+        font_ext = ET.SubElement(pt_font_info, _TAG_FONT_EXT, {
             'effect': self.font_info.effect,
             'underline': str(self.font_info.underline),
             'strikeout': str(self.font_info.strikeout),
@@ -188,7 +282,7 @@ class TextObject:
             A TextObject with parsed text and string items
         """
         # Extract the text content
-        data_elem = element.find('.//pt:data', NAMESPACES)
+        data_elem = _first(_XP_DATA, element)
         text = data_elem.text if data_elem is not None and data_elem.text else ""
 
         # Create the TextObject
@@ -196,15 +290,14 @@ class TextObject:
 
         # Extract string items
         start_pos = 0
-        for string_item_elem in element.findall('.//text:stringItem', NAMESPACES):
+        for string_item_elem in _XP_STRING_ITEMS(element):
             string_item = StringItem.from_element(string_item_elem, start_pos)
             text_obj.string_items.append(string_item)
             start_pos += string_item.char_len
 
-        # Validate that string items cover the entire text
-        total_len = sum(item.char_len for item in text_obj.string_items)
-        if total_len != len(text) and text_obj.string_items:
-            print(f"WARNING: String items total length ({total_len}) does not match text length ({len(text)})")
+        # Validate that string items cover the entire text; start_pos now holds their total length
+        if start_pos != len(text) and text_obj.string_items:
+            print(f"WARNING: String items total length ({start_pos}) does not match text length ({len(text)})")
 
         return text_obj
 
@@ -224,27 +317,14 @@ class TextObject:
             raise ValueError("This TextObject was not created from an XML element")
 
         # Update the text content
-        data_elem = self.element.find('.//pt:data', NAMESPACES)
+        data_elem = _first(_XP_DATA, self.element)
         if data_elem is not None:
             data_elem.text = self.text
 
         # First, locate the parent element that contains string items
         # This is crucial for maintaining the correct structure
-        string_items_parent = None
-        string_item_elems = []
-
-        # Find all existing string items and their parent
-        if self.element is not None:
-            string_item_elems = self.element.findall('.//text:stringItem', NAMESPACES)
-            if string_item_elems:
-                # Find the parent element
-                for parent in self.element.iter():
-                    for child in list(parent):
-                        if child in string_item_elems:
-                            string_items_parent = parent
-                            break
-                    if string_items_parent is not None:
-                        break
+        string_item_elems = _XP_STRING_ITEMS(self.element)
+        string_items_parent = _parent_of(self.element, string_item_elems[0]) if string_item_elems else None
 
         # Remove existing string items
         if string_items_parent is not None:
@@ -257,37 +337,16 @@ class TextObject:
         else:
             # If we couldn't find the parent, try to add them after pt:data
             # This is a fallback method
-            data_elem = self.element.find('.//pt:data', NAMESPACES)
-            if data_elem is not None:
-                # Find the parent of data_elem using a helper method
-                parent = self._find_parent(self.element, data_elem)
-                if parent is not None:
-                    for string_item in self.string_items:
-                        parent.append(string_item.to_element())
-                else:
-                    print("WARNING: Could not locate proper parent for string items")
+            data_elem = _first(_XP_DATA, self.element)
+            parent = _parent_of(self.element, data_elem) if data_elem is not None else None
+            if parent is not None:
+                for string_item in self.string_items:
+                    parent.append(string_item.to_element())
             else:
                 print("WARNING: Could not locate proper parent for string items")
 
         return self.element
 
-    def _find_parent(self, root: ET.Element, target: ET.Element) -> Optional[ET.Element]:
-        """
-        Helper method to find the parent element of a given target element.
-
-        Args:
-            root: The root element to start searching from
-            target: The element to find the parent of
-
-        Returns:
-            The parent element or None if not found
-        """
-        for parent in root.iter():
-            for child in list(parent):
-                if child == target:
-                    return parent
-        return None
-
     def validate(self) -> bool:
         """
         Validate that the TextObject has proper structure:
@@ -308,6 +367,15 @@ class TextObject:
 
         return True
 
+    def _item_start(self, item_index: int) -> int:
+        """
+        Return where a string item starts in the text.
+
+        This is worked out from the charLen values every time, since callers
+        can build string items or change their lengths directly.
+        """
+        return sum(item.char_len for item in self.string_items[:item_index])
+
     def edit_text(self, new_text: str) -> None:
         """
         Edit the text content and adjust string items accordingly.
@@ -328,6 +396,12 @@ class TextObject:
         old_length = len(self.text)
         new_length = len(new_text)
 
+        # Same length: every string item keeps its charLen, as long as they
+        # already cover the text; otherwise the rescale below corrects them
+        if new_length == old_length and sum(item.char_len for item in self.string_items) == old_length:
+            self.text = new_text
+            return
+
         # Simple case: empty text
         if old_length == 0:
             self.text = new_text
@@ -340,16 +414,13 @@ class TextObject:
         # Calculate scaling factor for each string item
         scale_factor = new_length / old_length
 
-        # Adjust character lengths proportionally
-        total_adjusted = 0
-        for i, item in enumerate(self.string_items[:-1]):  # Process all but the last item
-            new_len = round(item.char_len * scale_factor)
+        # Adjust character lengths proportionally, all but the last item
+        scaled_lengths = [round(item.char_len * scale_factor) for item in self.string_items[:-1]]
+        for item, new_len in zip(self.string_items, scaled_lengths):
             item.char_len = new_len
-            total_adjusted += new_len
 
         # Assign the remainder to the last item
-        if self.string_items:
-            self.string_items[-1].char_len = max(0, new_length - total_adjusted)
+        self.string_items[-1].char_len = max(0, new_length - sum(scaled_lengths))
 
         # Update the text
         self.text = new_text
@@ -371,11 +442,37 @@ class TextObject:
             Number of replacements made
         """
         if not case_sensitive:
-            pattern = re.compile(re.escape(find_text), re.IGNORECASE)
-            new_text, count = pattern.subn(replace_text, self.text)
-        else:
+            return self.find_replace_compiled(_compile_pattern(re.escape(find_text), re.IGNORECASE), replace_text)
+
+        new_text = self.text.replace(find_text, replace_text)
+
+        # Derive the count from the length change instead of scanning the text again
+        length_change = len(replace_text) - len(find_text)
+        if length_change:
+            count = (len(new_text) - len(self.text)) // length_change
+        elif new_text != self.text:
             count = self.text.count(find_text)
-            new_text = self.text.replace(find_text, replace_text)
+        else:
+            return 0
+
+        if count > 0:
+            self.edit_text(new_text)
+
+        return count
+
+    def find_replace_compiled(self, pattern: Pattern, replace_text: Union[str, Callable[[Match], str]]) -> int:
+        """
+        Find and replace text using an already compiled regular expression.
+
+        Args:
+            pattern: Compiled pattern to match
+            replace_text: Replacement text (can include group references like \1, \2),
+                or a function that returns the replacement for each match
+
+        Returns:
+            Number of replacements made
+        """
+        new_text, count = pattern.subn(replace_text, self.text)
 
         if count > 0:
             self.edit_text(new_text)
@@ -395,13 +492,7 @@ class TextObject:
             Number of replacements made
         """
         flags = 0 if case_sensitive else re.IGNORECASE
-        regex = re.compile(pattern, flags)
-        new_text, count = regex.subn(replace_text, self.text)
-
-        if count > 0:
-            self.edit_text(new_text)
-
-        return count
+        return self.find_replace_compiled(_compile_pattern(pattern, flags), replace_text)
 
     def split_string_item(self, item_index: int, position: int) -> None:
         """
@@ -421,7 +512,7 @@ class TextObject:
         # Create a new string item with the same font info
         new_item = StringItem(
             char_len=item.char_len - position,
-            font_info=FontInfo(**vars(item.font_info)),
+            font_info=dc_replace(item.font_info),
             start_pos=item.start_pos + position
         )
 
@@ -431,9 +522,6 @@ class TextObject:
         # Insert the new item after the original
         self.string_items.insert(item_index + 1, new_item)
 
-        # Validate after splitting
-        self.validate()
-
     def merge_string_items(self, start_index: int, end_index: int) -> None:
         """
         Merge multiple string items into a single item.
@@ -451,16 +539,13 @@ class TextObject:
         # Keep the font info of the first item
         merged_item = StringItem(
             char_len=total_len,
-            font_info=FontInfo(**vars(self.string_items[start_index].font_info)),
+            font_info=dc_replace(self.string_items[start_index].font_info),
             start_pos=self.string_items[start_index].start_pos
         )
 
         # Replace the range of items with the merged item
         self.string_items[start_index:end_index+1] = [merged_item]
 
-        # Validate after merging
-        self.validate()
-
     def delete_string_item(self, item_index: int) -> None:
         """
         Delete a string item and its corresponding text.
@@ -471,8 +556,9 @@ class TextObject:
         if item_index < 0 or item_index >= len(self.string_items):
             raise IndexError(f"String item index {item_index} out of range")
 
+        # Calculate the start and end positions in the text
         item = self.string_items[item_index]
-        start_pos = sum(si.char_len for si in self.string_items[:item_index])
+        start_pos = self._item_start(item_index)
         end_pos = start_pos + item.char_len
 
         # Remove the text
@@ -481,10 +567,6 @@ class TextObject:
         # Remove the string item
         self.string_items.pop(item_index)
 
-        # Update the start positions of subsequent items
-        for i in range(item_index, len(self.string_items)):
-            self.string_items[i].start_pos -= item.char_len
-
         # If we deleted the last string item, create a default one
         if not self.string_items and self.text:
             self.string_items = [StringItem(char_len=len(self.text), font_info=FontInfo())]
@@ -527,16 +609,13 @@ class TextObject:
             self.string_items.append(string_item)
         else:
             # Insert at position
-            start_pos = sum(si.char_len for si in self.string_items[:position])
+            start_pos = self._item_start(position)
             # Insert the text
             self.text = self.text[:start_pos] + text + self.text[start_pos:]
             # Create string item
             string_item = StringItem(char_len=len(text), font_info=font_info, start_pos=start_pos)
             # Insert into string items
             self.string_items.insert(position, string_item)
-            # Update start positions of subsequent items
-            for i in range(position + 1, len(self.string_items)):
-                self.string_items[i].start_pos += len(text)
 
         # Validate after adding
         self.validate()
@@ -547,9 +626,15 @@ class TextObject:
 class LBXTextEditor:
     """Main class for working with LBX label.xml files."""
 
-    def __init__(self, file_path: Optional[str] = None):
-        """Initialize the editor, optionally with a file path."""
+    def __init__(self, file_path: Optional[str] = None, strict: bool = False):
+        """
+        Initialize the editor, optionally with a file path.
+
+        With strict set, saving raises ValueError on an invalid text object
+        instead of warning and leaving that object's XML untouched.
+        """
         self.file_path = file_path
+        self.strict = strict
         self.tree = None
         self.root = None
         self.text_objects = []
@@ -560,10 +645,56 @@ class LBXTextEditor:
     def load(self, file_path: str) -> None:
         """Load and parse a label.xml file."""
         self.file_path = file_path
-        self.tree = ET.parse(file_path)
+        if LXML_AVAILABLE:
+            self.tree = ET.parse(file_path, ET.XMLParser(remove_blank_text=False, huge_tree=True))
+        else:
+            self.tree = ET.parse(file_path)
         self.root = self.tree.getroot()
         self._parse_text_objects()
 
+    def load_streaming(self, file_path: str) -> None:
+        """
+        Read the text objects from a label.xml file without keeping the document.
+
+        The text objects are not attached to a tree and cannot be saved; use
+        load() to edit a label.
+        """
+        self.file_path = file_path
+        self.tree = None
+        self.root = None
+        self.text_objects = list(self.stream_text_objects(file_path))
+
+    def stream_text_objects(self, file_path: str) -> Iterator[TextObject]:
+        """
+        Yield the text objects of a label.xml file one at a time.
+
+        Each text:text element is parsed as soon as it is complete and then
+        cleared, so memory stays flat on large labels. The editor's own state
+        is left untouched, and the yielded objects cannot be saved.
+        """
+        if LXML_AVAILABLE:
+            context = ET.iterparse(file_path, events=('end',), tag=_TAG_TEXT, huge_tree=True)
+        else:
+            context = ET.iterparse(file_path, events=('end',))
+
+        for _, elem in context:
+            if elem.tag != _TAG_TEXT:
+                continue
+
+            text_obj = TextObject.from_element(elem)
+            text_obj.validate()
+            text_obj.element = None
+            for string_item in text_obj.string_items:
+                string_item._source = None
+
+            # Drop the parsed element, and under lxml the emptied siblings before it
+            elem.clear()
+            if LXML_AVAILABLE:
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+            yield text_obj
+
     def _parse_text_objects(self) -> None:
         """Parse all text objects from the XML."""
         self.text_objects = []
@@ -574,13 +705,13 @@ class LBXTextEditor:
             return
 
         # Find all text:text elements
-        for text_elem in self.root.findall('.//text:text', NAMESPACES):
+        for text_elem in _XP_TEXT(self.root):
             text_obj = TextObject.from_element(text_elem)
             # Validate the text object
             text_obj.validate()
             self.text_objects.append(text_obj)
 
-    def save(self, output_path: Optional[str] = None) -> None:
+    def save(self, output_path: Optional[Union[str, BinaryIO]] = None) -> None:
         """
         Save changes back to the XML file.
 
@@ -589,16 +720,17 @@ class LBXTextEditor:
         2. Writing XML with proper encoding and declaration
 
         Args:
-            output_path: Path to save the XML file (uses original path if None)
+            output_path: Path or binary file object to save the XML to (uses original path if None)
         """
-        if not self.tree or not self.root:
+        if self.tree is None or self.root is None:
             raise ValueError("No XML data loaded")
 
-        # Update all text objects in the XML
+        # Update all text objects in the XML, validating each once here
         for text_obj in self.text_objects:
-            # Validate before saving
             if text_obj.validate():
                 text_obj.update_element()
+            elif self.strict:
+                raise ValueError(f"Invalid text object: {text_obj.text!r}")
             else:
                 print(f"WARNING: Invalid text object: {text_obj.text}")
 
@@ -623,35 +755,134 @@ class LBXTextEditor:
 
     def find_replace_all(self, find_text: str, replace_text: str, case_sensitive: bool = True) -> int:
         """Find and replace text in all text objects. Returns the number of replacements."""
+        total_replacements = 0
+        if case_sensitive:
+            for text_obj in self.text_objects:
+                total_replacements += text_obj.find_replace(find_text, replace_text)
+            return total_replacements
+
+        # Compile the case-insensitive pattern once for every text object
+        pattern = _compile_pattern(re.escape(find_text), re.IGNORECASE)
+        for text_obj in self.text_objects:
+            total_replacements += text_obj.find_replace_compiled(pattern, replace_text)
+        return total_replacements
+
+    def find_replace_many(self, replacements: List[Tuple[str, str]], case_sensitive: bool = True) -> int:
+        """
+        Replace several literal strings in all text objects in one pass.
+
+        The find strings are joined into one alternation, longest first, so
+        each text is scanned once and a longer match wins over a shorter one
+        starting at the same place.
+
+        Args:
+            replacements: (find, replace) pairs of literal text
+            case_sensitive: Whether the search is case-sensitive
+
+        Returns:
+            Total number of replacements made across all text objects
+        """
+        table = {find_text: replace_text for find_text, replace_text in replacements if find_text}
+        if not table:
+            return 0
+
+        finds = sorted(table, key=len, reverse=True)
+        pattern = _compile_pattern('|'.join(f'({re.escape(find_text)})' for find_text in finds),
+                                   0 if case_sensitive else re.IGNORECASE)
+        # Each find has its own group, so the match's lastindex says which one matched
+        replace_texts = [table[find_text] for find_text in finds]
+
+        def replace(match):
+            return replace_texts[match.lastindex - 1]
+
         total_replacements = 0
         for text_obj in self.text_objects:
-            total_replacements += text_obj.find_replace(find_text, replace_text, case_sensitive)
+            total_replacements += text_obj.find_replace_compiled(pattern, replace)
         return total_replacements
 
-    def regex_find_replace_all(self, pattern: str, replace_text: str, case_sensitive: bool = True) -> int:
+    def regex_find_replace_all(self, pattern: Union[str, Pattern], replace_text: str,
+                               case_sensitive: bool = True) -> int:
         """
         Find and replace text using regular expressions in all text objects.
 
         Args:
-            pattern: Regular expression pattern to match
+            pattern: Regular expression pattern to match, or an already compiled pattern
             replace_text: Replacement text (can include group references)
             case_sensitive: Whether the pattern matching should be case-sensitive
+                (ignored for a compiled pattern, which carries its own flags)
 
         Returns:
             Total number of replacements made across all text objects
         """
+        if isinstance(pattern, str):
+            regex = _compile_pattern(pattern, 0 if case_sensitive else re.IGNORECASE)
+        else:
+            regex = pattern
         total_replacements = 0
         for text_obj in self.text_objects:
-            total_replacements += text_obj.regex_find_replace(pattern, replace_text, case_sensitive)
+            total_replacements += text_obj.find_replace_compiled(regex, replace_text)
         return total_replacements
 
-    def extract_from_lbx(self, lbx_path: str, output_dir: Optional[str] = None) -> str:
+    def multi_regex_replace(self, rules: List[Tuple[str, str]], case_sensitive: bool = True) -> int:
+        """
+        Apply several regular expression replacements to all text objects in one pass.
+
+        The patterns are joined into a single alternation, so each text is scanned
+        once, and at every position the first rule that matches wins. Text produced
+        by one rule is not matched again by the others. Rules that cannot share one
+        pattern (backreferences that would be renumbered, group names used twice,
+        inline global flags) are applied one after another instead.
+
+        Args:
+            rules: (pattern, replacement) pairs; replacements can include group references
+            case_sensitive: Whether the pattern matching should be case-sensitive
+
+        Returns:
+            Total number of replacements made across all text objects
+        """
+        if not rules:
+            return 0
+
+        # Compile every rule first, so an invalid pattern fails before any text changes
+        flags = 0 if case_sensitive else re.IGNORECASE
+        regexes = [_compile_pattern(pattern, flags) for pattern, _ in rules]
+
+        combined = None
+        if not any(_BACKREFERENCE_RE.search(pattern) for pattern, _ in rules):
+            # Wrap each rule in a group and note its index, which is the match's lastindex
+            compiled_rules = {}
+            group_index = 1
+            for regex, (_, replace_text) in zip(regexes, rules):
+                compiled_rules[group_index] = (regex, replace_text)
+                group_index += regex.groups + 1
+            try:
+                combined = re.compile('|'.join(f'({pattern})' for pattern, _ in rules), flags)
+            except re.error:
+                # The rules compile on their own but conflict when joined
+                combined = None
+
+        if combined is None:
+            return sum(self.regex_find_replace_all(regex, replace_text)
+                       for regex, (_, replace_text) in zip(regexes, rules))
+
+        def expand(match):
+            # Rematch with the rule on its own so group references keep their numbering
+            regex, replace_text = compiled_rules[match.lastindex]
+            return regex.match(match.string, match.start()).expand(replace_text)
+
+        total_replacements = 0
+        for text_obj in self.text_objects:
+            total_replacements += text_obj.find_replace_compiled(combined, expand)
+        return total_replacements
+
+    def extract_from_lbx(self, lbx_path: str, output_dir: Optional[str] = None, full: bool = False) -> str:
         """
         Extract label.xml from an LBX file.
 
         Args:
             lbx_path: Path to the LBX file
             output_dir: Directory to extract to (temporary directory if None)
+            full: Extract every member of the archive, not just label.xml
 
         Returns:
             Path to the extracted label.xml file
@@ -659,10 +890,15 @@ class LBXTextEditor:
         if output_dir is None:
             output_dir = tempfile.mkdtemp()
 
+        label_xml_path = os.path.join(output_dir, 'label.xml')
+
         with zipfile.ZipFile(lbx_path, 'r') as zip_ref:
-            zip_ref.extractall(output_dir)
+            if full:
+                zip_ref.extractall(output_dir)
+            elif 'label.xml' in zip_ref.namelist():
+                with zip_ref.open('label.xml') as src, open(label_xml_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
 
-        label_xml_path = os.path.join(output_dir, 'label.xml')
         if not os.path.exists(label_xml_path):
             raise FileNotFoundError(f"label.xml not found in {lbx_path}")
 
@@ -682,31 +918,42 @@ class LBXTextEditor:
         if output_path is None:
             output_path = lbx_path
 
-        # Create a temporary directory
-        temp_dir = tempfile.mkdtemp()
+        # Serialize the updated XML in memory
+        xml_buffer = io.BytesIO()
+        self.save(xml_buffer)
+
+        # Copy the members straight into a new archive in memory, substituting label.xml
+        archive_buffer = io.BytesIO()
+        with zipfile.ZipFile(lbx_path, 'r') as zip_in, zipfile.ZipFile(archive_buffer, 'w') as zip_out:
+            for info in zip_in.infolist():
+                out_info = zipfile.ZipInfo(info.filename, info.date_time)
+                out_info.external_attr = info.external_attr
+
+                # Deflate XML and bitmaps, store already-compressed images as they are
+                out_info.compress_type, compresslevel = zip_compression(info.filename)
+
+                if info.filename == 'label.xml':
+                    zip_out.writestr(out_info, xml_buffer.getvalue(), compresslevel=compresslevel)
+                elif compresslevel is None:
+                    # Stored members need no compressor, so they are streamed across
+                    out_info.file_size = info.file_size
+                    with zip_in.open(info) as src, zip_out.open(out_info, 'w') as dst:
+                        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+                else:
+                    zip_out.writestr(out_info, zip_in.read(info), compresslevel=compresslevel)
 
+        # Write the finished archive in one go to a temporary file, then move it
+        # into place, so the output can replace the input safely
+        temp_path = output_path + '.tmp'
         try:
-            # Extract the LBX
-            with zipfile.ZipFile(lbx_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-
-            # Save the updated XML
-            label_xml_path = os.path.join(temp_dir, 'label.xml')
-            self.save(label_xml_path)
-
-            # Create a new LBX file
-            with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as zip_out:
-                for root, _, files in os.walk(temp_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, temp_dir)
-                        zip_out.write(file_path, arcname)
-
+            with open(temp_path, 'wb') as f:
+                f.write(archive_buffer.getbuffer())
+            os.replace(temp_path, output_path)
             return output_path
 
         finally:
-            # Clean up the temporary directory
-            shutil.rmtree(temp_dir)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
 
 
 def main():
@@ -731,6 +978,7 @@ def main():
     edit_parser.add_argument('-i', '--index', type=int, required=True, help='Index of text object to edit')
     edit_parser.add_argument('-t', '--text', required=True, help='New text content')
     edit_parser.add_argument('-o', '--output', help='Output file')
+    edit_parser.add_argument('--strict', action='store_true', help='Fail instead of warning on invalid text objects')
 
     # Find and replace command
     replace_parser = subparsers.add_parser('replace', help='Find and replace text')
@@ -740,6 +988,16 @@ def main():
     replace_parser.add_argument('-i', '--ignore-case', action='store_true', help='Ignore case when finding')
     replace_parser.add_argument('-o', '--output', help='Output file')
     replace_parser.add_argument('--regex', action='store_true', help='Use regular expressions for pattern matching')
+    replace_parser.add_argument('--strict', action='store_true', help='Fail instead of warning on invalid text objects')
+
+    # Replace several strings at once
+    replace_many_parser = subparsers.add_parser('replace-many', help='Find and replace several strings in one pass')
+    replace_many_parser.add_argument('input', help='Input label.xml file or LBX file')
+    replace_many_parser.add_argument('-p', '--pair', nargs=2, action='append', required=True,
+                                     metavar=('FIND', 'REPLACE'), help='Text to find and its replacement (repeatable)')
+    replace_many_parser.add_argument('-i', '--ignore-case', action='store_true', help='Ignore case when finding')
+    replace_many_parser.add_argument('-o', '--output', help='Output file')
+    replace_many_parser.add_argument('--strict', action='store_true', help='Fail instead of warning on invalid text objects')
 
     args = parser.parse_args()
 
@@ -750,23 +1008,21 @@ def main():
     # Handle extract command
     if args.command == 'extract':
         editor = LBXTextEditor()
-        output_path = editor.extract_from_lbx(args.input, args.output)
+        output_path = editor.extract_from_lbx(args.input, args.output, full=True)
         print(f"Extracted label.xml to: {output_path}")
         return
 
     # Load the input file
-    editor = LBXTextEditor()
+    editor = LBXTextEditor(strict=getattr(args, 'strict', False))
     input_file = args.input
     is_lbx = input_file.lower().endswith('.lbx')
 
     if is_lbx:
         input_file = editor.extract_from_lbx(args.input)
 
-    editor.load(input_file)
-
-    # Handle list command
+    # Listing only reads the text objects, so print each one as it is parsed
     if args.command == 'list':
-        for i, text_obj in enumerate(editor.get_text_objects()):
+        for i, text_obj in enumerate(editor.stream_text_objects(input_file)):
             print(f"Text Object {i}:")
             print(f"  Content: {repr(text_obj.text)}")
             print(f"  String Items: {len(text_obj.string_items)}")
@@ -775,9 +1031,12 @@ def main():
                       f"font={item.font_info.name}, "
                       f"weight={item.font_info.weight}, "
                       f"size={item.font_info.size}")
+        return
+
+    editor.load(input_file)
 
     # Handle edit command
-    elif args.command == 'edit':
+    if args.command == 'edit':
         try:
             text_obj = editor.get_text_object_by_index(args.index)
             text_obj.edit_text(args.text)
@@ -791,19 +1050,32 @@ def main():
             print(f"Text updated and saved to: {output}")
         except IndexError:
             print(f"Error: Text object index {args.index} not found")
-
-    # Handle replace command
-    elif args.command == 'replace':
-        if args.regex:
+        except ValueError as e:
+            print(f"Error: {e}")
+
+    # Handle replace commands
+    elif args.command in ('replace', 'replace-many'):
+        if args.command == 'replace-many':
+            count = editor.find_replace_many(args.pair, not args.ignore_case)
+        elif args.regex:
             count = editor.regex_find_replace_all(args.find, args.replace, not args.ignore_case)
         else:
             count = editor.find_replace_all(args.find, args.replace, not args.ignore_case)
 
+        # Nothing changed, so there is nothing to write
+        if count == 0:
+            print("No matches found. No file was written.")
+            return
+
         output = args.output or input_file
-        if is_lbx and args.output:
-            editor.update_lbx(args.input, args.output)
-        else:
-            editor.save(output)
+        try:
+            if is_lbx and args.output:
+                editor.update_lbx(args.input, args.output)
+            else:
+                editor.save(output)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
 
         print(f"Replaced {count} occurrences. Updated file saved to: {output}")
 
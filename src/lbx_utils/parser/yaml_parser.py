@@ -19,6 +19,12 @@ from ..models import (
 from ..utils import convert_to_pt
 from ..utils.conversion import MM_TO_PT, PT_TO_MM
 
+# libyaml's C loader is far faster; PyYAML built without libyaml only has the Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Create console for rich output
 console = Console()
 
@@ -50,8 +56,9 @@ class YamlParser:
         if not os.path.exists(self.yaml_file):
             raise FileNotFoundError(f"YAML file not found: {self.yaml_file}")
 
-        with open(self.yaml_file, 'r') as f:
-            self.yaml_data = yaml.safe_load(f)
+        # libyaml reads bytes directly and detects the encoding itself
+        with open(self.yaml_file, 'rb') as f:
+            self.yaml_data = yaml.load(f, Loader=SafeLoader)
 
         # Create a default label config
         config = LabelConfig()
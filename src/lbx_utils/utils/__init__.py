@@ -4,6 +4,7 @@ Utilities for lbxyml2lbx
 
 from .constants import NAMESPACES, LABEL_SIZES, DEFAULT_PRINTER_ID, DEFAULT_PRINTER_NAME
 from .conversion import convert_to_pt
+from .archive import zip_compression
 
 __all__ = [
     'NAMESPACES',
@@ -11,4 +12,5 @@ __all__ = [
     'DEFAULT_PRINTER_ID',
     'DEFAULT_PRINTER_NAME',
     'convert_to_pt',
+    'zip_compression',
 ]
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ZIP archive helpers shared by the tools that write LBX files
+"""
+
+import os
+import zipfile
+from typing import Optional, Tuple
+
+# Image formats that are already compressed, so deflating them again gains nothing
+PRECOMPRESSED_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif'})
+
+
+def zip_compression(file_name: str) -> Tuple[int, Optional[int]]:
+    """Return the (compress_type, compresslevel) to use for an LBX archive member."""
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension == '.xml':
+        return zipfile.ZIP_DEFLATED, 6
+    if extension in PRECOMPRESSED_IMAGE_EXTENSIONS:
+        return zipfile.ZIP_STORED, None
+    # Uncompressed bitmaps compress well, but a fast level gets most of the benefit
+    return zipfile.ZIP_DEFLATED, 1
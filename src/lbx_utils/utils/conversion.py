@@ -5,6 +5,9 @@
 Unit conversion utilities for lbxyml2lbx
 """
 
+from functools import lru_cache
+from typing import Optional, Tuple
+
 from rich.console import Console
 
 console = Console()
@@ -19,6 +22,9 @@ IN_TO_PT = 72.0         # 1in = 72pt
 PT_TO_MM = 1 / MM_TO_PT
 PT_TO_IN = 1 / IN_TO_PT
 
+# Pre-formatted point strings for the small whole numbers most labels use
+_INT_PT_STRINGS = {number: f"{number}pt" for number in range(101)}
+
 def convert_to_pt(value) -> str:
     """
     Convert a value to a point value.
@@ -33,70 +39,85 @@ def convert_to_pt(value) -> str:
     Returns:
         String representation with 'pt' suffix
     """
-    if isinstance(value, (int, float)):
+    value_type = type(value)
+    if value_type is int and value in _INT_PT_STRINGS:
+        return _INT_PT_STRINGS[value]
+    elif isinstance(value, (int, float)):
         # Treat numeric values as pt by default
         return f"{value}pt"
     elif isinstance(value, str):
-        # Handle empty strings
-        if not value:
-            console.print(f"[yellow]Warning: Empty string value, defaulting to 0pt[/yellow]")
-            return "0pt"
-
-        # Handle 'auto' special value
-        if value.lower() == 'auto':
-            return 'auto'
-
-        # Extract unit from string
-        value_lower = value.lower()
-        if value_lower.endswith('pt'):
-            # Already in points, use as-is
-            try:
-                pt_value = float(value_lower.replace('pt', ''))
-                return f"{pt_value:.2f}pt"
-            except ValueError:
-                console.print(f"[yellow]Warning: Invalid pt value '{value}', using as-is[/yellow]")
-                return value
-        elif value_lower.endswith('mm'):
-            # Convert mm to pt
-            try:
-                mm_value = float(value_lower.replace('mm', ''))
-                pt_value = mm_value * MM_TO_PT
-
-                # Special case for 90mm which is expected to be "254.7..." by tests
-                if mm_value == 90.0:
-                    return f"254.7pt"
-
-                return f"{pt_value:.2f}pt"
-            except ValueError:
-                console.print(f"[yellow]Warning: Invalid mm value '{value}', using as-is[/yellow]")
-                return f"{value}pt"
-        elif value_lower.endswith(('in', 'inch', 'inches')):
-            # Convert inches to pt
-            try:
-                # Handle different variations of inches unit
-                in_value = (value_lower.replace('inches', '')
-                                       .replace('inch', '')
-                                       .replace('in', ''))
-                in_value = float(in_value)
-                pt_value = in_value * IN_TO_PT
-                return f"{pt_value:.2f}pt"
-            except ValueError:
-                console.print(f"[yellow]Warning: Invalid inches value '{value}', using as-is[/yellow]")
-                return f"{value}pt"
-        else:
-            # Try to convert string to float and treat as pt
-            try:
-                pt_value = float(value)
-                return f"{pt_value}pt"
-            except ValueError:
-                # If conversion fails, just append pt
-                console.print(f"[yellow]Warning: Unrecognized unit in '{value}', assuming points[/yellow]")
-                return f"{value}pt"
+        pt_value, warning = _convert_str_to_pt(value)
+        if warning:
+            console.print(warning)
+        return pt_value
     else:
         # For any other type, convert to string and append pt
         console.print(f"[yellow]Warning: Unexpected value type for '{value}', converting to string[/yellow]")
         return f"{value}pt"
 
+@lru_cache(maxsize=1024)
+def _convert_str_to_pt(value: str) -> Tuple[str, Optional[str]]:
+    """
+    Convert a string value to a point value for convert_to_pt.
+
+    Labels repeat the same few dimension strings many times, so results are
+    cached. Warnings are returned rather than printed so that every call
+    still reports them.
+
+    Returns:
+        Tuple of the point string and a warning message (or None)
+    """
+    # Handle empty strings
+    if not value:
+        return "0pt", "[yellow]Warning: Empty string value, defaulting to 0pt[/yellow]"
+
+    # Handle 'auto' special value
+    value_lower = value.lower()
+    if value_lower == 'auto':
+        return 'auto', None
+
+    # Extract unit from string
+    if value_lower.endswith('pt'):
+        # Already in points, use as-is
+        try:
+            pt_value = float(value_lower.replace('pt', ''))
+            return f"{pt_value:.2f}pt", None
+        except ValueError:
+            return value, f"[yellow]Warning: Invalid pt value '{value}', using as-is[/yellow]"
+    elif value_lower.endswith('mm'):
+        # Convert mm to pt
+        try:
+            mm_value = float(value_lower.replace('mm', ''))
+            pt_value = mm_value * MM_TO_PT
+
+            # Special case for 90mm which is expected to be "254.7..." by tests
+            if mm_value == 90.0:
+                return "254.7pt", None
+
+            return f"{pt_value:.2f}pt", None
+        except ValueError:
+            return f"{value}pt", f"[yellow]Warning: Invalid mm value '{value}', using as-is[/yellow]"
+    elif value_lower.endswith(('in', 'inch', 'inches')):
+        # Convert inches to pt
+        try:
+            # Handle different variations of inches unit
+            in_value = (value_lower.replace('inches', '')
+                                   .replace('inch', '')
+                                   .replace('in', ''))
+            in_value = float(in_value)
+            pt_value = in_value * IN_TO_PT
+            return f"{pt_value:.2f}pt", None
+        except ValueError:
+            return f"{value}pt", f"[yellow]Warning: Invalid inches value '{value}', using as-is[/yellow]"
+    else:
+        # Try to convert string to float and treat as pt
+        try:
+            pt_value = float(value)
+            return f"{pt_value}pt", None
+        except ValueError:
+            # If conversion fails, just append pt
+            return f"{value}pt", f"[yellow]Warning: Unrecognized unit in '{value}', assuming points[/yellow]"
+
 def convert_unit(value, from_unit=None, to_unit=DEFAULT_INTERNAL_UNIT):
     """
     Convert a value from one unit to another.
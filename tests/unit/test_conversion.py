@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Tests for the unit conversion helpers.
+"""
+
+import pytest
+
+from lbx_utils.utils import conversion
+from lbx_utils.utils.conversion import convert_to_pt
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('value, expected', [
+    (0, "0pt"),
+    (12, "12pt"),
+    (150, "150pt"),
+    (1.0, "1.0pt"),
+    (True, "Truept"),
+    ("3pt", "3.00pt"),
+    ("10mm", "28.35pt"),
+    ("90mm", "254.7pt"),
+    ("1in", "72.00pt"),
+    ("12", "12.0pt"),
+    ("Auto", "auto"),
+])
+def test_convert_to_pt(value, expected):
+    """Numbers are taken as points and unit suffixes are converted."""
+    assert convert_to_pt(value) == expected
+
+
+@pytest.mark.unit
+def test_convert_to_pt_warns_on_every_call(monkeypatch):
+    """Cached string conversions still print their warning each time."""
+    warnings = []
+    monkeypatch.setattr(conversion.console, 'print', warnings.append)
+
+    assert convert_to_pt("wide") == "widept"
+    assert convert_to_pt("wide") == "widept"
+    assert len(warnings) == 2
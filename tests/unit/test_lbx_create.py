@@ -591,6 +591,113 @@ class LBXCreateTestCase(unittest.TestCase):
             self.assertIn(original_name, [original_image1, original_image2],
                          f"originalName {original_name} not found in expected values")
 
+    def test_15_rgba_image_conversion(self):
+        """Test that transparent pixels are flattened to white when converting to BMP."""
+        from PIL import Image
+
+        rgba_image = os.path.join(TEST_IMAGES_DIR, "rgba.png")
+        img = Image.new('RGBA', (20, 20), (0, 0, 0, 0))
+        img.paste((0, 0, 0, 255), (0, 0, 10, 20))
+        img.save(rgba_image)
+
+        output_file = os.path.join(OUTPUT_DIR, "15_rgba_image_conversion.lbx")
+        self._run_lbx_create(output_file, "--image", rgba_image, "--convert-images")
+        file_list = self._verify_lbx_file(output_file)
+
+        bmp_files = [f for f in file_list if f.endswith(".bmp")]
+        self.assertEqual(len(bmp_files), 1, "Expected exactly 1 BMP file in LBX")
+
+        extract_dir = os.path.join(OUTPUT_DIR, os.path.splitext(os.path.basename(output_file))[0])
+        with Image.open(os.path.join(extract_dir, bmp_files[0])) as bmp:
+            self.assertEqual(bmp.mode, "RGB")
+            self.assertEqual(bmp.getpixel((0, 0)), (0, 0, 0))
+            self.assertEqual(bmp.getpixel((19, 0)), (255, 255, 255))
+
+    def test_16_bmp_image_conversion_passthrough(self):
+        """Test that an RGB BMP is stored unchanged when converting images."""
+        from PIL import Image
+
+        bmp_image = os.path.join(TEST_IMAGES_DIR, "rgb.bmp")
+        Image.new('RGB', (20, 20), color='green').save(bmp_image)
+
+        output_file = os.path.join(OUTPUT_DIR, "16_bmp_image_conversion_passthrough.lbx")
+        self._run_lbx_create(output_file, "--image", bmp_image, "--convert-images")
+        file_list = self._verify_lbx_file(output_file)
+
+        bmp_files = [f for f in file_list if f.startswith("Object") and f.endswith(".bmp")]
+        self.assertEqual(len(bmp_files), 1, "Expected exactly 1 BMP file in LBX")
+
+        with zipfile.ZipFile(output_file, 'r') as zipf, open(bmp_image, 'rb') as f:
+            self.assertEqual(zipf.read(bmp_files[0]), f.read())
+
+    def test_17_member_compression(self):
+        """Test that XML and BMP members are deflated while PNG members are stored."""
+        output_file = os.path.join(OUTPUT_DIR, "17_member_compression.lbx")
+        self._run_lbx_create(output_file, "--text", "Compression", "--image", IMAGE1)
+
+        with zipfile.ZipFile(output_file, 'r') as zipf:
+            compression = {info.filename: info.compress_type for info in zipf.infolist()}
+
+        self.assertEqual(compression["label.xml"], zipfile.ZIP_DEFLATED)
+        self.assertEqual(compression["prop.xml"], zipfile.ZIP_DEFLATED)
+        self.assertEqual(compression[os.path.basename(IMAGE1)], zipfile.ZIP_STORED)
+
+    def test_18_cached_pt_geometry(self):
+        """Test that cached pt floats follow reassigned geometry strings."""
+        from lbx_utils.lbx_create import create_default_text_object
+
+        text_obj = create_default_text_object("Cached", x="10pt", height="20pt")
+        self.assertEqual(text_obj.x_pt, 10.0)
+        self.assertEqual(text_obj.height_pt, 20.0)
+
+        text_obj.x = "12.5pt"
+        self.assertEqual(text_obj.x_pt, 12.5)
+
+    def test_19_oversized_image_conversion(self):
+        """Test that oversized images are downscaled to the printed size when converting."""
+        from PIL import Image
+
+        large_image = os.path.join(TEST_IMAGES_DIR, "large.jpg")
+        Image.new('RGB', (2000, 1000), color='red').save(large_image)
+
+        output_file = os.path.join(OUTPUT_DIR, "19_oversized_image_conversion.lbx")
+        self._run_lbx_create(output_file, "--image", large_image, "--convert-images")
+        file_list = self._verify_lbx_file(output_file)
+
+        bmp_files = [f for f in file_list if f.endswith(".bmp")]
+        extract_dir = os.path.join(OUTPUT_DIR, os.path.splitext(os.path.basename(output_file))[0])
+        with Image.open(os.path.join(extract_dir, bmp_files[0])) as bmp:
+            # The default 20pt image box is 50px at 180 DPI; aspect ratio is preserved
+            self.assertEqual(bmp.size, (50, 25))
+
+    def test_20_large_image_conversion_uses_png(self):
+        """Test that large converted images are stored as PNG instead of BMP."""
+        from PIL import Image
+        from lbx_utils.lbx_create import LBXCreator, LabelConfig, create_image_object
+
+        large_image = os.path.join(TEST_IMAGES_DIR, "large_box.png")
+        Image.new('RGB', (1000, 400), color='red').save(large_image)
+
+        config = LabelConfig(size_mm=24)
+        config.image_objects.append(
+            create_image_object(large_image, width="300pt", height="100pt", convert_to_bmp=True)
+        )
+
+        output_file = os.path.join(OUTPUT_DIR, "20_large_image_conversion_uses_png.lbx")
+        creator = LBXCreator(config)
+        try:
+            creator.create_lbx(output_file)
+        finally:
+            creator.cleanup()
+
+        file_list = self._verify_lbx_file(output_file)
+        image_files = [f for f in file_list if f.startswith("Object")]
+        self.assertEqual(len(image_files), 1, "Expected exactly 1 converted image in LBX")
+        self.assertTrue(image_files[0].endswith(".png"), f"Expected a PNG, got {image_files[0]}")
+
+        with zipfile.ZipFile(output_file, 'r') as zipf:
+            self.assertIn(f'fileName="{image_files[0]}"', zipf.read("label.xml").decode("utf-8"))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
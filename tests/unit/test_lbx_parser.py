@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Tests for the LBX parser.
+
+These tests build small LBX archives on the fly and check what the parser
+extracts from them.
+"""
+
+import io
+import os
+import sqlite3
+import weakref
+import zipfile
+from xml.etree import ElementTree
+
+import pytest
+from PIL import Image
+
+from lbx_utils import lbx_parser
+from lbx_utils.lbx_parser import (
+    LbxDocument, _bmp_to_transparent_png, _convert_bmp_members, extract_all_from_lbx, extract_images_from_lbx,
+    extract_text_from_lbx, find_lbx_files, modify_label_xml, sanitize_filename
+)
+
+LABEL_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<pt:document xmlns:pt="http://schemas.brother.info/ptouch/2007/lbx/main"
+    xmlns:text="http://schemas.brother.info/ptouch/2007/lbx/text"
+    xmlns:image="http://schemas.brother.info/ptouch/2007/lbx/image">
+  <pt:body>
+    <pt:objects>
+      <text:text>
+        <pt:data>  3001
+  Brick 2 x 4
+
+</pt:data>
+      </text:text>
+      <text:text>
+        <pt:data>Tom &amp; Jerry</pt:data>
+      </text:text>
+      <text:text>
+        <pt:data>   </pt:data>
+      </text:text>
+      <image:image>
+        <image:imageStyle originalName="3001.png" alignInText="LEFT" fileName="Object0.bmp"/>
+      </image:image>
+    </pt:objects>
+  </pt:body>
+</pt:document>
+"""
+
+
+@pytest.fixture
+def sample_lbx(tmp_path):
+    """Write a minimal LBX archive with text blocks and an image reference."""
+    lbx_path = tmp_path / "sample.lbx"
+    with zipfile.ZipFile(lbx_path, 'w') as zf:
+        zf.writestr('label.xml', LABEL_XML)
+        zf.writestr('prop.xml', '<meta:properties/>')
+        zf.writestr('Object0.bmp', b'BM')
+    return str(lbx_path)
+
+
+@pytest.mark.unit
+def test_extract_text_from_lbx(sample_lbx):
+    """Text blocks are stripped line by line, unescaped, and empty blocks are dropped."""
+    assert extract_text_from_lbx(sample_lbx) == ["3001\nBrick 2 x 4", "Tom & Jerry"]
+
+
+@pytest.mark.unit
+def test_extract_images_from_shared_document(sample_lbx):
+    """Text and image extraction can share one open document."""
+    with LbxDocument(sample_lbx) as document:
+        text_blocks = extract_text_from_lbx(sample_lbx, document=document)
+        images_info = extract_images_from_lbx(sample_lbx, extract_images=True, document=document)
+
+    assert text_blocks == ["3001\nBrick 2 x 4", "Tom & Jerry"]
+    assert images_info == [{
+        'filename': 'Object0.bmp',
+        'base_name': 'Object0.bmp',
+        'original_name': '3001.png'
+    }]
+
+
+@pytest.mark.unit
+def test_extract_all_from_lbx(sample_lbx):
+    """Text blocks and image info come back together from a single call."""
+    text_blocks, images_info = extract_all_from_lbx(sample_lbx)
+
+    assert text_blocks == ["3001\nBrick 2 x 4", "Tom & Jerry"]
+    assert [img_info['original_name'] for img_info in images_info] == ['3001.png']
+
+
+@pytest.mark.unit
+def test_sanitize_filename():
+    """Accents are folded to ASCII, unsafe characters dropped and spaces replaced."""
+    assert sanitize_filename("Brick 2 x 4 Café ﬁne") == "Brick_2_x_4_Cafe_fine"
+    assert sanitize_filename("Plate 1 × 2 / Round") == "Plate_1__2__Round"
+    assert sanitize_filename("Ω" * 10 + "a" * 40) == "a" * 30
+
+
+@pytest.mark.unit
+def test_modify_label_xml_converts_bmp(tmp_path):
+    """BMP members become PNGs with transparent white, and label.xml points at them."""
+    img = Image.new('RGB', (20, 10), 'white')
+    img.paste((0, 0, 0), (5, 2, 15, 8))
+    bmp_data = io.BytesIO()
+    img.save(bmp_data, 'BMP')
+
+    lbx_path = str(tmp_path / "bmp.lbx")
+    with zipfile.ZipFile(lbx_path, 'w') as zf:
+        zf.writestr('label.xml', LABEL_XML.replace('3001.png', '3001.bmp'))
+        zf.writestr('Object0.bmp', bmp_data.getvalue())
+
+    images_info = extract_images_from_lbx(lbx_path, extract_images=True)
+    assert modify_label_xml(lbx_path, images_info)
+
+    with zipfile.ZipFile(lbx_path) as zf:
+        assert sorted(zf.namelist()) == ['3001.png', 'label.xml']
+        assert 'originalName="3001.png"' in zf.read('label.xml').decode()
+        assert 'fileName="3001.png"' in zf.read('label.xml').decode()
+        png = Image.open(io.BytesIO(zf.read('3001.png')))
+        assert png.mode == 'RGBA'
+        assert png.getpixel((0, 0))[3] == 0
+        assert png.getpixel((6, 3)) == (0, 0, 0, 255)
+
+    assert (tmp_path / "bmp.lbx.bak").exists()
+
+
+@pytest.mark.unit
+def test_modify_label_xml_keeps_images_sharing_an_original_name(tmp_path):
+    """Two BMPs placed from the same part image each get their own PNG member."""
+    bmp_members = {}
+    for member_name, box in [('Object0.bmp', (5, 2, 15, 8)), ('Object1.bmp', (0, 0, 4, 4))]:
+        img = Image.new('RGB', (20, 10), 'white')
+        img.paste((0, 0, 0), box)
+        bmp_data = io.BytesIO()
+        img.save(bmp_data, 'BMP')
+        bmp_members[member_name] = bmp_data.getvalue()
+
+    second_image = (
+        '<image:image>\n'
+        '        <image:imageStyle originalName="3001.bmp" alignInText="LEFT" fileName="Object1.bmp"/>\n'
+        '      </image:image>\n'
+        '    </pt:objects>'
+    )
+    label_xml = LABEL_XML.replace('3001.png', '3001.bmp').replace('</pt:objects>', second_image, 1)
+
+    lbx_path = str(tmp_path / "twice.lbx")
+    with zipfile.ZipFile(lbx_path, 'w') as zf:
+        zf.writestr('label.xml', label_xml)
+        for member_name, data in bmp_members.items():
+            zf.writestr(member_name, data)
+
+    images_info = extract_images_from_lbx(lbx_path, extract_images=True)
+    assert modify_label_xml(lbx_path, images_info)
+
+    with zipfile.ZipFile(lbx_path) as zf:
+        assert sorted(zf.namelist()) == ['3001.png', 'Object1.png', 'label.xml']
+        xml = zf.read('label.xml').decode()
+        assert 'fileName="3001.png"' in xml
+        assert 'fileName="Object1.png"' in xml
+        first = Image.open(io.BytesIO(zf.read('3001.png'))).convert('RGBA')
+        second = Image.open(io.BytesIO(zf.read('Object1.png'))).convert('RGBA')
+        assert first.getpixel((6, 3)) == (0, 0, 0, 255)
+        assert second.getpixel((6, 3))[3] == 0
+        assert second.getpixel((1, 1)) == (0, 0, 0, 255)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('mode', ['1', 'L', 'P'])
+def test_bmp_to_transparent_png_keeps_low_bit_modes(mode):
+    """Palette and grayscale bitmaps keep their mode, with white marked transparent."""
+    img = Image.new('RGB', (20, 10), 'white')
+    img.paste((0, 0, 0), (5, 2, 15, 8))
+    img = img.convert('P', palette=Image.ADAPTIVE, colors=2) if mode == 'P' else img.convert(mode)
+    bmp_data = io.BytesIO()
+    img.save(bmp_data, 'BMP')
+    bmp_data.seek(0)
+
+    png = Image.open(io.BytesIO(_bmp_to_transparent_png(bmp_data)))
+    assert png.mode == mode
+    assert png.convert('RGBA').getpixel((0, 0))[3] == 0
+    assert png.convert('RGBA').getpixel((6, 3)) == (0, 0, 0, 255)
+
+
+@pytest.mark.unit
+def test_lbx_document_reads_from_disk_until_released(sample_lbx):
+    """The archive is read from the file; release_file() moves it into memory and keeps it readable."""
+    with LbxDocument(sample_lbx) as document:
+        assert not isinstance(document.zip.fp, io.BytesIO)
+
+        document.release_file()
+        os.remove(sample_lbx)
+
+        assert isinstance(document.zip.fp, io.BytesIO)
+        assert document.zip.read('Object0.bmp') == b'BM'
+        assert document.data_texts[1] == "Tom & Jerry"
+
+
+@pytest.mark.unit
+def test_convert_bmp_members_converts_identical_bitmaps_once(tmp_path, monkeypatch):
+    """Members with the same content share one conversion; unreadable ones are left out."""
+    def bmp_bytes(box):
+        img = Image.new('RGB', (20, 10), 'white')
+        img.paste((0, 0, 0), box)
+        bmp_data = io.BytesIO()
+        img.save(bmp_data, 'BMP')
+        return bmp_data.getvalue()
+
+    lbx_path = tmp_path / "icons.lbx"
+    with zipfile.ZipFile(lbx_path, 'w') as zf:
+        zf.writestr('Object0.bmp', bmp_bytes((5, 2, 15, 8)))
+        zf.writestr('Object1.bmp', bmp_bytes((5, 2, 15, 8)))
+        zf.writestr('Object2.bmp', bmp_bytes((0, 0, 4, 4)))
+        zf.writestr('Object3.bmp', b'BM not really a bitmap')
+
+    monkeypatch.setattr('lbx_utils.lbx_parser.imagemagick_command', lambda: None)
+    opened = []
+    with zipfile.ZipFile(lbx_path) as zf:
+        original_open = zf.open
+
+        def counting_open(name, *args, **kwargs):
+            opened.append(name)
+            return original_open(name, *args, **kwargs)
+
+        monkeypatch.setattr(zf, 'open', counting_open)
+        converted = _convert_bmp_members(zf, ['Object0.bmp', 'Object1.bmp', 'Object2.bmp', 'Object3.bmp'])
+
+    assert sorted(converted) == ['Object0.bmp', 'Object1.bmp', 'Object2.bmp']
+    assert converted['Object0.bmp'] is converted['Object1.bmp']
+    assert converted['Object0.bmp'] != converted['Object2.bmp']
+    assert sorted(opened) == ['Object0.bmp', 'Object2.bmp', 'Object3.bmp']
+
+
+@pytest.mark.unit
+def test_find_lbx_files_in_name_order(tmp_path):
+    """LBX files come back in name order, directory by directory, skipping other files and symlinked directories."""
+    for relative_path in ['b.lbx', 'a.LBX', 'notes.txt', 'sub2/d.lbx', 'sub1/c.lbx', 'sub1/deeper/e.lbx']:
+        path = tmp_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'')
+    (tmp_path / 'linked').symlink_to(tmp_path / 'sub2', target_is_directory=True)
+
+    found = [os.path.relpath(path, tmp_path) for path in find_lbx_files(str(tmp_path))]
+
+    assert found == ['a.LBX', 'b.lbx', 'sub1/c.lbx', 'sub1/deeper/e.lbx', 'sub2/d.lbx']
+    assert [os.path.basename(path) for path in find_lbx_files(str(tmp_path), recursive=False)] == ['a.LBX', 'b.lbx']
+
+
+@pytest.mark.unit
+def test_iter_label_elements_elementtree_fallback_frees_elements(monkeypatch):
+    """Without lxml, finished elements are dropped from their parents, so they can be freed."""
+    monkeypatch.setattr(lbx_parser, 'LXML_AVAILABLE', False)
+    monkeypatch.setattr(lbx_parser, 'etree', ElementTree)
+    objects = ''.join(
+        f'<text:text><pt:objectStyle x="1pt"/><pt:data>Part {i}</pt:data></text:text>' for i in range(200)
+    )
+    xml = LABEL_XML.replace('<pt:objects>', '<pt:objects>' + objects, 1).encode('utf-8')
+
+    texts = []
+    element_refs = []
+    most_alive = 0
+    for elem in lbx_parser._iter_label_elements(io.BytesIO(xml)):
+        if elem.tag == lbx_parser.PT_DATA_TAG:
+            texts.append(elem.text)
+        # While parsing goes on, the elements yielded earlier should already be gone
+        most_alive = max(most_alive, sum(ref() is not None for ref in element_refs))
+        element_refs.append(weakref.ref(elem))
+
+    assert texts[:2] == ['Part 0', 'Part 1']
+    assert len(texts) == 203
+    assert most_alive <= 1
+
+
+@pytest.fixture
+def parts_db(monkeypatch):
+    """An in-memory parts table in place of the real database, with a log of the SELECTs run on it."""
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE parts (part_num TEXT, name TEXT, label_file TEXT)")
+    conn.executemany("INSERT INTO parts VALUES (?, ?, NULL)", [('3001', 'Brick 2 x 4'), ('3004', 'Brick 1 x 2')])
+    selects = []
+
+    def log_select(statement):
+        if statement.startswith('SELECT'):
+            selects.append(statement)
+
+    conn.set_trace_callback(log_select)
+    monkeypatch.setattr(lbx_parser, '_DB_CONNECTION', conn)
+    lbx_parser.clear_part_name_cache()
+    yield selects
+    lbx_parser.clear_part_name_cache()
+    conn.close()
+
+
+@pytest.mark.unit
+def test_part_names_are_cached(parts_db):
+    """Repeat lookups, including of unknown parts, are answered without another query."""
+    assert lbx_parser.get_part_names(['3001', '9999']) == {'3001': 'Brick 2 x 4'}
+    assert lbx_parser.get_part_names(['9999', '3001']) == {'3001': 'Brick 2 x 4'}
+    assert lbx_parser.get_part_info('3001') == 'Brick 2 x 4'
+    assert len(parts_db) == 1
+
+    # Only the parts not seen yet are queried
+    assert lbx_parser.get_part_names(['3001', '3004']) == {'3001': 'Brick 2 x 4', '3004': 'Brick 1 x 2'}
+    assert len(parts_db) == 2
+    assert parts_db[1].endswith("IN ('3004')")
+
+    # Updating label files leaves the cached names valid
+    assert lbx_parser.update_part_label_files(['3001'], 'labels.lbx') == 1
+    assert lbx_parser.get_part_info('3001') == 'Brick 2 x 4'
+    assert len(parts_db) == 2
+
+
+@pytest.mark.unit
+def test_part_name_cache_is_bounded(parts_db, monkeypatch):
+    """The least recently used names are dropped once the cache is full."""
+    monkeypatch.setattr(lbx_parser, 'PART_NAME_CACHE_SIZE', 2)
+
+    lbx_parser.get_part_names(['3001'])
+    lbx_parser.get_part_names(['3004'])
+    lbx_parser.get_part_names(['3001'])
+    lbx_parser.get_part_names(['9999'])
+    assert list(lbx_parser._PART_NAME_CACHE) == ['3001', '9999']
+
+    lbx_parser.get_part_names(['3004'])
+    assert len(parts_db) == 4
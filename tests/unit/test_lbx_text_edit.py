@@ -7,7 +7,9 @@ various text manipulation operations on LBX label files.
 """
 
 import os
+import re
 import sys
+import zipfile
 import pytest
 from pathlib import Path
 
@@ -17,6 +19,43 @@ from lbx_utils.lbx_text_edit import LBXTextEditor, TextObject, StringItem, FontI
 TEST_SAMPLE = "data/label_examples/30182.lbx"
 TEMP_DIR = "test_output/lbx_text_edit"
 
+# Minimal label.xml with one text object per text, for tests that build their own label
+SMALL_LABEL_TEXT = """<text:text><pt:data>{text}</pt:data>{string_items}</text:text>"""
+SMALL_LABEL_STRING_ITEM = """<text:stringItem charLen="{length}"><text:ptFontInfo>\
+<text:logFont name="Helsinki Narrow" width="0" italic="false" weight="{weight}" charSet="0" pitchAndFamily="2"/>\
+<text:fontExt effect="NOEFFECT" underline="0" strikeout="0" size="8pt" orgSize="28.8pt" textColor="#000000" \
+textPrintColorNumber="1"/></text:ptFontInfo></text:stringItem>"""
+SMALL_LABEL_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<pt:document xmlns:pt="http://schemas.brother.info/ptouch/2007/lbx/main" \
+xmlns:style="http://schemas.brother.info/ptouch/2007/lbx/style" \
+xmlns:text="http://schemas.brother.info/ptouch/2007/lbx/text"><pt:body><style:sheet name="Sheet 1">\
+<pt:objects>{objects}</pt:objects></style:sheet></pt:body></pt:document>"""
+
+
+@pytest.fixture
+def small_label(tmp_path):
+    """
+    Return a function that writes a label.xml with the given texts and returns its path.
+
+    A text given as a list of segments gets one string item per segment,
+    alternating between normal and bold.
+    """
+    def _text_object(text):
+        segments = [text] if isinstance(text, str) else text
+        string_items = ''.join(
+            SMALL_LABEL_STRING_ITEM.format(length=len(segment), weight=700 if index % 2 else 400)
+            for index, segment in enumerate(segments)
+        )
+        return SMALL_LABEL_TEXT.format(text=''.join(segments), string_items=string_items)
+
+    def _write(*texts):
+        objects = ''.join(map(_text_object, texts))
+        xml_path = tmp_path / "label.xml"
+        xml_path.write_text(SMALL_LABEL_XML.format(objects=objects), encoding='utf-8')
+        return str(xml_path)
+    return _write
+
+
 # Test functions
 @pytest.mark.unit
 def test_delete_first_string_item(lbx_text_editor, test_sample, temp_dir):
@@ -449,4 +488,441 @@ def test_add_string_item(lbx_text_editor, test_sample):
     added_item = text_obj.string_items[-1]
     assert added_item.font_info.name == "Arial"
     assert added_item.font_info.weight == 700
-    assert added_item.char_len == len(" - Added Text")
\ No newline at end of file
+    assert added_item.char_len == len(" - Added Text")
+
+@pytest.mark.unit
+def test_multi_regex_replace(small_label):
+    """The first rule that matches at a position wins, and group references are expanded."""
+    editor = LBXTextEditor(small_label("Beam 1 x 11", "Plate 2 x 4"))
+
+    count = editor.multi_regex_replace([
+        (r'(\d+) x (\d+)', r'\2 by \1'),
+        (r'\d+', 'N'),
+        (r'Beam|Plate', 'Part'),
+    ])
+
+    assert count == 4
+    assert [text_obj.text for text_obj in editor.get_text_objects()] == ["Part 11 by 1", "Part 4 by 2"]
+    assert all(text_obj.validate() for text_obj in editor.get_text_objects())
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('rules, expected', [
+    # A backreference would be renumbered in the combined pattern
+    ([(r'(o)\1', '0'), (r'b', 'B')], "B0k"),
+    # The same group name in two rules
+    ([(r'(?P<n>o)k', r'\g<n>K'), (r'(?P<n>b)', r'\g<n>!')], "b!ooK"),
+    # Inline global flags that must start the whole pattern
+    ([('x', 'y'), ('(?i)B', 'c')], "cook"),
+])
+def test_multi_regex_replace_falls_back_to_one_rule_at_a_time(small_label, rules, expected):
+    """Rules that cannot be joined into one pattern are applied in turn."""
+    editor = LBXTextEditor(small_label("book"))
+
+    editor.multi_regex_replace(rules)
+
+    assert editor.get_text_object_by_index(0).text == expected
+
+
+@pytest.mark.unit
+def test_multi_regex_replace_conflicting_rules_without_text():
+    """Conflicting rules do not raise, even with no text objects loaded."""
+    editor = LBXTextEditor()
+
+    assert editor.multi_regex_replace([(r'(?P<n>\d+)x', 'a'), (r'(?P<n>\d+)y', 'b')]) == 0
+    assert editor.multi_regex_replace([('a', 'b'), ('(?i)c', 'd')]) == 0
+
+@pytest.mark.unit
+def test_stream_text_objects_matches_load(small_label):
+    """Streaming yields the same texts and string items as a full load."""
+    xml_path = small_label("Technic Beam", "1 x 11", "30182")
+    loaded = LBXTextEditor(xml_path).get_text_objects()
+
+    streamed = list(LBXTextEditor().stream_text_objects(xml_path))
+    assert [(t.text, len(t.string_items)) for t in streamed] == [(t.text, len(t.string_items)) for t in loaded]
+
+    editor = LBXTextEditor()
+    editor.load_streaming(xml_path)
+    assert [t.text for t in editor.get_text_objects()] == ["Technic Beam", "1 x 11", "30182"]
+    assert editor.root is None
+
+@pytest.mark.unit
+def test_find_replace_many(small_label):
+    """The longest find wins where finds overlap, and the count covers every text object."""
+    editor = LBXTextEditor(small_label("ab a b", "AB"))
+
+    count = editor.find_replace_many([('a', '1'), ('ab', '2'), ('b', '3')])
+
+    assert count == 3
+    assert [t.text for t in editor.get_text_objects()] == ["2 1 3", "AB"]
+    assert all(t.validate() for t in editor.get_text_objects())
+
+
+@pytest.mark.unit
+def test_find_replace_many_ignore_case(small_label):
+    """Case-insensitive replacement matches any case of each find."""
+    editor = LBXTextEditor(small_label("ab a b", "AB"))
+
+    assert editor.find_replace_many([('a', '1'), ('AB', '2')], case_sensitive=False) == 3
+    assert [t.text for t in editor.get_text_objects()] == ["2 1 b", "2"]
+
+
+@pytest.mark.unit
+def test_replace_many_command(small_label, tmp_path, monkeypatch, capsys):
+    """The replace-many command applies every pair and reports the total count."""
+    from lbx_utils import lbx_text_edit
+
+    xml_path = small_label("ab a b", "AB")
+    output_path = str(tmp_path / "out.xml")
+    monkeypatch.setattr(sys, 'argv', ['lbx_text_edit.py', 'replace-many', xml_path,
+                                      '-p', 'a', '1', '-p', 'ab', '2', '-i', '-o', output_path])
+
+    lbx_text_edit.main()
+
+    assert f"Replaced 3 occurrences. Updated file saved to: {output_path}" in capsys.readouterr().out
+    assert [t.text for t in LBXTextEditor(output_path).get_text_objects()] == ["2 1 b", "2"]
+
+@pytest.mark.unit
+def test_update_lbx_round_trip(small_label, tmp_path):
+    """label.xml is replaced, other members are copied as they are and no temporary file is left."""
+    xml_path = small_label("Brick 2 x 4")
+    png_data = bytes(range(256)) * 8
+    lbx_path = str(tmp_path / "label.lbx")
+    with zipfile.ZipFile(lbx_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.write(xml_path, 'label.xml')
+        zf.writestr('prop.xml', '<meta:properties xmlns:meta="x"/>')
+        zf.writestr('3001.png', png_data)
+
+    (tmp_path / "extracted").mkdir()
+    (tmp_path / "reloaded").mkdir()
+
+    editor = LBXTextEditor()
+    editor.load(editor.extract_from_lbx(lbx_path, str(tmp_path / "extracted")))
+    editor.find_replace_all(" x ", "×")
+
+    assert editor.update_lbx(lbx_path) == lbx_path
+
+    with zipfile.ZipFile(lbx_path) as zf:
+        assert zf.namelist() == ['label.xml', 'prop.xml', '3001.png']
+        assert "Brick 2×4" in zf.read('label.xml').decode('utf-8')
+        assert zf.read('prop.xml') == b'<meta:properties xmlns:meta="x"/>'
+        assert zf.read('3001.png') == png_data
+        assert zf.getinfo('3001.png').compress_type == zipfile.ZIP_STORED
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+    reloaded = LBXTextEditor(editor.extract_from_lbx(lbx_path, str(tmp_path / "reloaded")))
+    assert reloaded.get_text_object_by_index(0).text == "Brick 2×4"
+    assert reloaded.get_text_object_by_index(0).validate()
+
+
+def _hand_built_text_object(text, *char_lens):
+    """A text object whose string items are built directly, so their start_pos is left at 0."""
+    return TextObject(text=text, string_items=[
+        StringItem(char_len=char_len, font_info=FontInfo()) for char_len in char_lens
+    ])
+
+
+@pytest.mark.unit
+def test_delete_string_item_after_the_first(small_label):
+    """Deleting a later item removes that item's text, wherever its start_pos says."""
+    text_obj = _hand_built_text_object("HelloWorld", 5, 5)
+    text_obj.delete_string_item(1)
+    assert text_obj.text == "Hello"
+    assert [item.char_len for item in text_obj.string_items] == [5]
+
+    # Lengths changed directly are honoured too
+    text_obj = _hand_built_text_object("HelloWorld", 5, 5)
+    text_obj.string_items[0].char_len = 3
+    text_obj.string_items[1].char_len = 7
+    text_obj.delete_string_item(1)
+    assert text_obj.text == "Hel"
+
+    # Items read from a label that was edited first
+    editor = LBXTextEditor(small_label("Hello"))
+    text_obj = editor.get_text_object_by_index(0)
+    text_obj.add_string_item("World")
+    text_obj.edit_text("Hi there, World")
+    assert [item.char_len for item in text_obj.string_items] == [8, 7]
+    text_obj.delete_string_item(1)
+    assert text_obj.text == "Hi there"
+
+
+@pytest.mark.unit
+def test_add_string_item_at_a_later_position():
+    """Inserting before a later item puts the text at that item's start."""
+    text_obj = _hand_built_text_object("HelloWorld", 5, 5)
+
+    text_obj.add_string_item("XX", position=1)
+
+    assert text_obj.text == "HelloXXWorld"
+    assert [item.char_len for item in text_obj.string_items] == [5, 2, 5]
+    assert text_obj.validate()
+
+
+@pytest.mark.unit
+def test_edit_text_then_insert_uses_current_lengths(small_label):
+    """After lengths are changed directly and the text rescaled, inserts land on item boundaries."""
+    editor = LBXTextEditor(small_label("HelloWorld"))
+    text_obj = editor.get_text_object_by_index(0)
+    text_obj.split_string_item(0, 5)
+    text_obj.string_items[0].char_len = 2
+    text_obj.string_items[1].char_len = 8
+
+    text_obj.edit_text("HeLLOWORLDHELLOWORLD")
+    assert [item.char_len for item in text_obj.string_items] == [4, 16]
+
+    text_obj.add_string_item("--", position=1)
+    assert text_obj.text == "HeLL--OWORLDHELLOWORLD"
+    assert text_obj.validate()
+
+
+@pytest.mark.unit
+def test_same_length_edit_corrects_mismatched_lengths():
+    """A same-length edit still fixes string items that do not add up to the text."""
+    text_obj = _hand_built_text_object("HelloWorld", 5, 3)
+
+    text_obj.edit_text("HELLOworld")
+
+    assert text_obj.text == "HELLOworld"
+    assert [item.char_len for item in text_obj.string_items] == [5, 5]
+    assert text_obj.validate()
+
+
+@pytest.mark.unit
+def test_same_length_edit_keeps_matching_lengths():
+    """A same-length edit leaves consistent string items as they are."""
+    text_obj = _hand_built_text_object("HelloWorld", 3, 7)
+
+    text_obj.edit_text("HELLOworld")
+
+    assert [item.char_len for item in text_obj.string_items] == [3, 7]
+
+
+@pytest.mark.unit
+def test_find_replace_many_overlapping_finds(small_label):
+    """Overlapping finds: the leftmost match wins, then the longest, and replacements are not rescanned."""
+    editor = LBXTextEditor(small_label("abcd"))
+
+    count = editor.find_replace_many([('bc', 'X'), ('abc', 'Y'), ('cd', 'Z'), ('Y', 'never')])
+
+    assert count == 1
+    assert editor.get_text_object_by_index(0).text == "Yd"
+
+
+@pytest.mark.unit
+def test_find_replace_many_treats_finds_literally(small_label):
+    """Regex characters in finds are matched literally, empty finds are ignored and a repeated find uses its last replacement."""
+    editor = LBXTextEditor(small_label("1.5 x (2) x 1x5"))
+
+    count = editor.find_replace_many([('', 'never'), ('1.5', 'A'), ('(2)', 'B'), ('x', '*'), ('x', '×')])
+
+    assert count == 5
+    assert editor.get_text_object_by_index(0).text == "A × B × 1×5"
+
+
+@pytest.mark.unit
+def test_find_replace_many_without_matches(small_label):
+    """No matches, or nothing to look for, leaves the text and its string items alone."""
+    editor = LBXTextEditor(small_label("Brick"))
+    text_obj = editor.get_text_object_by_index(0)
+
+    assert editor.find_replace_many([('Plate', 'Tile')]) == 0
+    assert editor.find_replace_many([]) == 0
+    assert editor.find_replace_many([('', 'x')]) == 0
+    assert text_obj.text == "Brick"
+    assert [item.char_len for item in text_obj.string_items] == [5]
+
+
+@pytest.mark.unit
+def test_replace_many_command_without_matches(small_label, tmp_path, monkeypatch, capsys):
+    """When no pair matches, the command says so and writes nothing."""
+    from lbx_utils import lbx_text_edit
+
+    xml_path = small_label("Brick")
+    output_path = tmp_path / "out.xml"
+    monkeypatch.setattr(sys, 'argv', ['lbx_text_edit.py', 'replace-many', xml_path,
+                                      '-p', 'Plate', 'Tile', '-o', str(output_path)])
+
+    lbx_text_edit.main()
+
+    assert "No matches found. No file was written." in capsys.readouterr().out
+    assert not output_path.exists()
+
+
+@pytest.mark.unit
+def test_replace_many_command_needs_a_pair(small_label, monkeypatch, capsys):
+    """The command refuses to run without at least one -p pair."""
+    from lbx_utils import lbx_text_edit
+
+    monkeypatch.setattr(sys, 'argv', ['lbx_text_edit.py', 'replace-many', small_label("Brick")])
+
+    with pytest.raises(SystemExit):
+        lbx_text_edit.main()
+    assert "-p/--pair" in capsys.readouterr().err
+
+
+def _write_lbx(lbx_path, xml_path, members):
+    """Write an LBX archive holding xml_path as label.xml, then the given (ZipInfo, data) members."""
+    with zipfile.ZipFile(lbx_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.write(xml_path, 'label.xml')
+        for info, data in members:
+            zf.writestr(info, data)
+
+
+@pytest.mark.unit
+def test_update_lbx_to_a_new_file_keeps_every_member(small_label, tmp_path):
+    """Writing to another path leaves the input alone and carries every other member across unchanged."""
+    bmp_info = zipfile.ZipInfo('Object0.bmp', (2020, 1, 2, 3, 4, 6))
+    bmp_info.compress_type = zipfile.ZIP_DEFLATED
+    bmp_info.external_attr = 0o644 << 16
+    members = [
+        (zipfile.ZipInfo('prop.xml', (2020, 1, 2, 3, 4, 6)), b'<meta:properties xmlns:meta="x"/>'),
+        (bmp_info, b'BM' + bytes(range(256)) * 4),
+        (zipfile.ZipInfo('3001.png', (2021, 5, 6, 7, 8, 10)), b'\x89PNG' + bytes(512)),
+    ]
+    lbx_path = tmp_path / "in.lbx"
+    _write_lbx(lbx_path, small_label("Brick 2 x 4"), members)
+    original_bytes = lbx_path.read_bytes()
+
+    editor = LBXTextEditor(small_label("Brick 2 x 4"))
+    editor.find_replace_all("Brick", "Plate")
+    output_path = str(tmp_path / "out.lbx")
+
+    assert editor.update_lbx(str(lbx_path), output_path) == output_path
+    assert lbx_path.read_bytes() == original_bytes
+
+    with zipfile.ZipFile(output_path) as zf:
+        assert zf.namelist() == ['label.xml', 'prop.xml', 'Object0.bmp', '3001.png']
+        assert "Plate 2 x 4" in zf.read('label.xml').decode('utf-8')
+        for info, data in members:
+            out_info = zf.getinfo(info.filename)
+            assert zf.read(out_info) == data
+            assert out_info.date_time == info.date_time
+        assert zf.getinfo('Object0.bmp').external_attr == 0o644 << 16
+        assert zf.getinfo('Object0.bmp').compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo('3001.png').compress_type == zipfile.ZIP_STORED
+
+
+@pytest.mark.unit
+def test_update_lbx_leaves_the_archive_alone_when_saving_fails(small_label, tmp_path):
+    """A strict editor that refuses to save does not touch the archive or leave a temporary file."""
+    lbx_path = tmp_path / "in.lbx"
+    _write_lbx(lbx_path, small_label("Brick"), [(zipfile.ZipInfo('prop.xml'), b'<p/>')])
+    original_bytes = lbx_path.read_bytes()
+
+    editor = LBXTextEditor(small_label("Brick"), strict=True)
+    editor.get_text_object_by_index(0).string_items[0].char_len = 2
+
+    with pytest.raises(ValueError, match="Invalid text object"):
+        editor.update_lbx(str(lbx_path))
+
+    assert lbx_path.read_bytes() == original_bytes
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+@pytest.mark.unit
+def test_update_lbx_missing_archive(small_label, tmp_path):
+    """A missing input archive raises without creating the output or a temporary file."""
+    editor = LBXTextEditor(small_label("Brick"))
+    output_path = tmp_path / "out.lbx"
+
+    with pytest.raises(FileNotFoundError):
+        editor.update_lbx(str(tmp_path / "missing.lbx"), str(output_path))
+
+    assert not output_path.exists()
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+@pytest.mark.unit
+def test_multi_regex_replace_ignore_case_and_named_groups(small_label):
+    """Case-insensitive rules match any case, and named group references are expanded per rule."""
+    editor = LBXTextEditor(small_label("BRICK 2X4 plate 1x2"))
+
+    count = editor.multi_regex_replace([
+        (r'(?P<w>\d+)x(?P<l>\d+)', r'\g<w>×\g<l>'),
+        (r'brick|plate', 'part'),
+    ], case_sensitive=False)
+
+    assert count == 4
+    assert editor.get_text_object_by_index(0).text == "part 2×4 part 1×2"
+
+
+@pytest.mark.unit
+def test_multi_regex_replace_does_not_rescan_replacements(small_label):
+    """Text produced by one rule is not matched again by a later rule."""
+    editor = LBXTextEditor(small_label("a-b"))
+
+    assert editor.multi_regex_replace([('a', 'b'), ('b', 'c')]) == 2
+    assert editor.get_text_object_by_index(0).text == "b-c"
+
+
+@pytest.mark.unit
+def test_multi_regex_replace_invalid_pattern(small_label):
+    """An invalid pattern raises re.error before any text is changed."""
+    editor = LBXTextEditor(small_label("Brick", "Plate"))
+
+    with pytest.raises(re.error):
+        editor.multi_regex_replace([('Brick', 'Part'), ('(unclosed', 'x')])
+    # Also when a backreference sends the rules down the one-at-a-time path
+    with pytest.raises(re.error):
+        editor.multi_regex_replace([(r'(B)\1?rick', 'Part'), ('(unclosed', 'x')])
+
+    assert [t.text for t in editor.get_text_objects()] == ["Brick", "Plate"]
+    assert editor.multi_regex_replace([]) == 0
+
+
+@pytest.mark.unit
+def test_stream_text_objects_reads_string_items(small_label):
+    """Streamed objects carry every string item with its length, offset and font."""
+    xml_path = small_label(["Technic Beam\n", "1 x 11"], "30182")
+
+    first, second = LBXTextEditor().stream_text_objects(xml_path)
+
+    assert first.text == "Technic Beam\n1 x 11"
+    assert [(item.char_len, item.start_pos, item.font_info.weight) for item in first.string_items] == [
+        (13, 0, 400), (6, 13, 700)
+    ]
+    assert second.text == "30182"
+
+
+@pytest.mark.unit
+def test_stream_text_objects_are_detached(small_label):
+    """Streaming leaves the editor as it was, and the objects it yields hold no XML."""
+    xml_path = small_label(["Brick ", "2 x 4"])
+    editor = LBXTextEditor()
+
+    text_obj = next(editor.stream_text_objects(xml_path))
+
+    assert text_obj.element is None
+    assert all(item._source is None for item in text_obj.string_items)
+    assert editor.text_objects == [] and editor.root is None and editor.file_path is None
+
+
+@pytest.mark.unit
+def test_load_streaming_cannot_save(small_label, tmp_path):
+    """A streamed label has no document to write back."""
+    editor = LBXTextEditor()
+    editor.load_streaming(small_label("Brick"))
+
+    with pytest.raises(ValueError, match="No XML data loaded"):
+        editor.save(str(tmp_path / "out.xml"))
+
+
+@pytest.mark.unit
+def test_stream_text_objects_warns_on_mismatched_lengths(small_label, tmp_path, capsys):
+    """A text object whose string items do not cover its text is still yielded, with a warning."""
+    xml_path = small_label("Brick")
+    xml = Path(xml_path).read_text(encoding='utf-8').replace('charLen="5"', 'charLen="3"')
+    Path(xml_path).write_text(xml, encoding='utf-8')
+
+    (text_obj,) = LBXTextEditor().stream_text_objects(xml_path)
+
+    assert text_obj.text == "Brick"
+    assert not text_obj.validate()
+    assert "does not match text length" in capsys.readouterr().out
+
+
+@pytest.mark.unit
+def test_stream_text_objects_empty_label(small_label):
+    """A label without text objects yields nothing."""
+    assert list(LBXTextEditor().stream_text_objects(small_label())) == []